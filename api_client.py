@@ -2,18 +2,140 @@
 fal.ai API 클라이언트
 Usage API 호출 및 페이지네이션 처리
 """
-import requests  # type: ignore
 import time
-from typing import Optional, List, Dict, Any, Tuple
+import json
+import copy
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple, Iterator
 from datetime import datetime, timezone, timedelta
-from zoneinfo import ZoneInfo
+from urllib.parse import urlencode, quote_plus
 import date_utils
 import config
 
+# requests(urllib3, ssl 등)는 무거우므로 실제 API 호출 시점에 import
+if TYPE_CHECKING:
+    from zoneinfo import ZoneInfo
+    import requests  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 
 BASE_URL = "https://api.fal.ai/v1/models"
 USAGE_ENDPOINT = f"{BASE_URL}/usage"
 
+# 모델별 개별 호출 시 동시에 실행할 최대 요청 수 (Rate Limit 고려)
+MAX_CONCURRENT_REQUESTS = 8
+
+# 응답 캐시 TTL (초)
+PRICING_CACHE_TTL = 3600     # 가격 정보는 자주 바뀌지 않음
+USAGE_CACHE_TTL = 86400      # 하루 이상 지난 기간의 사용량은 변하지 않음
+
+
+class _TTLCache:
+    """
+    만료 시간이 있는 프로세스 내 응답 캐시 (스레드 안전)
+    
+    호출한 쪽에서 결과를 수정해도 캐시가 오염되지 않도록
+    저장할 때와 꺼낼 때 모두 깊은 복사본을 사용
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            now = time.monotonic()
+            # 조회되지 않고 만료된 항목이 계속 쌓이지 않도록 저장할 때 정리
+            expired = [k for k, (expires_at, _) in self._data.items() if expires_at < now]
+            for k in expired:
+                del self._data[k]
+            self._data[key] = (now + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# 클라이언트 인스턴스 간 공유 (인터랙티브 모드에서 반복 조회 시 재사용)
+_response_cache = _TTLCache()
+
+
+def _make_cache_key(url: str, params: Dict[str, Any], api_key: str) -> str:
+    """URL + 정규화된 파라미터 + API 키로 캐시 키 생성 (키별 데이터 분리)"""
+    payload = json.dumps({"url": url, "params": params, "api_key": api_key}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _parse_json(response: "requests.Response") -> Any:
+    """응답 본문 JSON 파싱 (orjson이 설치되어 있으면 bytes를 직접 파싱)"""
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _is_historical(end_str: str) -> bool:
+    """조회 종료 시점이 하루 이상 지났는지 확인 (과거 데이터는 변경되지 않으므로 캐시 가능)"""
+    try:
+        end_dt = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    if end_dt.tzinfo is None:
+        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    return end_dt < datetime.now(timezone.utc) - timedelta(days=1)
+
+
+def _parse_bucket(bucket: str, target_tz: Optional["ZoneInfo"] = None) -> Optional[datetime]:
+    """
+    bucket 문자열을 datetime으로 파싱 (UTC로 가정) 후 사용자 타임존으로 변환
+    
+    Returns:
+        변환된 datetime (파싱 실패 시 None)
+    """
+    # fal.ai 기본 형식 "YYYY-MM-DDTHH:MM:SSZ"는 슬라이스로 직접 파싱
+    if len(bucket) == 20 and bucket[-1] == 'Z' and bucket[10] == 'T':
+        try:
+            dt = datetime(
+                int(bucket[0:4]), int(bucket[5:7]), int(bucket[8:10]),
+                int(bucket[11:13]), int(bucket[14:16]), int(bucket[17:19]),
+                tzinfo=timezone.utc
+            )
+            return dt.astimezone(target_tz) if target_tz else dt
+        except ValueError:
+            return None
+    
+    try:
+        # 그 외 ISO8601 형식: "2024-01-01T00:00:00+00:00" 등
+        dt = datetime.fromisoformat(bucket.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+    # UTC로 명시적으로 설정 (타임존 정보가 없으면 UTC로 가정)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    else:
+        dt = dt.astimezone(timezone.utc)
+    if target_tz:
+        dt = dt.astimezone(target_tz)
+    return dt
+
 
 def extract_date_range_from_time_series(
     time_series: List[Dict[str, Any]], 
@@ -39,37 +161,41 @@ def extract_date_range_from_time_series(
     if not time_series or not isinstance(time_series, list):
         return None, None
     
-    buckets = []
+    bucket_strs = []
     for entry in time_series:
         if not isinstance(entry, dict):
             continue
         bucket = entry.get("bucket")
         if bucket and isinstance(bucket, str):
-            try:
-                # bucket을 datetime으로 파싱 (UTC로 가정)
-                # ISO8601 형식: "2024-01-01T00:00:00Z" 또는 "2024-01-01T00:00:00+00:00"
-                bucket_str = bucket.replace('Z', '+00:00')
-                dt = datetime.fromisoformat(bucket_str)
-                # UTC로 명시적으로 설정 (타임존 정보가 없으면 UTC로 가정)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                else:
-                    # 이미 타임존이 있으면 UTC로 변환
-                    dt = dt.astimezone(timezone.utc)
-                
-                # 사용자 타임존으로 변환
-                if target_timezone:
-                    try:
-                        target_tz = ZoneInfo(target_timezone)
-                        dt = dt.astimezone(target_tz)
-                    except Exception:
-                        # 타임존 변환 실패 시 UTC 그대로 사용
-                        pass
-                
-                buckets.append(dt)
-            except (ValueError, AttributeError):
-                # 파싱 실패 시 무시
-                continue
+            bucket_strs.append(bucket)
+    
+    if not bucket_strs:
+        return None, None
+    
+    # 사용자 타임존 (변환 실패 시 UTC 그대로 사용)
+    target_tz = None
+    if target_timezone:
+        try:
+            target_tz = date_utils.get_zoneinfo(target_timezone)
+        except Exception:
+            pass
+    
+    # 모든 bucket이 같은 길이와 같은 오프셋 접미사(예: "Z", "+09:00")를 가지면
+    # 문자열 순서가 곧 시간 순서이므로 최소/최대 두 값만 파싱
+    first = bucket_strs[0]
+    suffix = first[19:]
+    if len(first) >= 19 and all(len(b) == len(first) and b.endswith(suffix) for b in bucket_strs):
+        min_bucket = _parse_bucket(min(bucket_strs), target_tz)
+        max_bucket = _parse_bucket(max(bucket_strs), target_tz)
+        if min_bucket and max_bucket:
+            return min_bucket.isoformat(), max_bucket.isoformat()
+    
+    # 형식이 섞여 있으면 전체 파싱 후 비교
+    buckets = []
+    for bucket in bucket_strs:
+        dt = _parse_bucket(bucket, target_tz)
+        if dt:
+            buckets.append(dt)
     
     if not buckets:
         return None, None
@@ -86,6 +212,77 @@ def extract_date_range_from_time_series(
     return min_str, max_str
 
 
+def _as_list(value: Any) -> List[Any]:
+    """응답 필드 값을 리스트로 정규화 (리스트는 그대로, 단일 값은 감싸고, 빈 값은 빈 리스트)"""
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def _build_result(all_data: List[Any]) -> Dict[str, Any]:
+    """
+    페이지별로 수집한 데이터를 하나의 응답 딕셔너리로 구성
+    all_data가 비어있거나 리스트인 경우 항상 딕셔너리로 래핑
+    """
+    if not all_data:
+        return {
+            "items": [],
+            "total_count": 0
+        }
+    if len(all_data) == 1 and isinstance(all_data[0], dict):
+        # 단일 딕셔너리인 경우 그대로 사용
+        return all_data[0]
+    # 여러 항목인 경우 items로 래핑
+    return {
+        "items": all_data,
+        "total_count": len(all_data)
+    }
+
+
+def _finalize_result(
+    result: Dict[str, Any],
+    start_str: str,
+    end_str: str,
+    timeframe: Optional[str],
+    timezone: str,
+    endpoint_ids: List[str],
+    expand: List[str],
+    bound_to_timeframe: bool
+) -> Dict[str, Any]:
+    """
+    time_series에서 실제 조회 기간을 추출하여 _meta 추가/업데이트
+    bucket은 UTC이므로 사용자 타임존으로 변환
+    
+    bound_to_timeframe이 꺼져 있으면 요청한 기간이 그대로 실제 기간이고,
+    expand에 time_series가 없으면 bucket이 없으므로 추출을 건너뜀
+    """
+    actual_start = start_str
+    actual_end = end_str
+    if bound_to_timeframe and "time_series" in expand:
+        time_series = result.get("time_series")
+        if time_series:
+            bucket_start, bucket_end = extract_date_range_from_time_series(
+                time_series, 
+                timezone, 
+                timeframe, 
+                bound_to_timeframe
+            )
+            if bucket_start and bucket_end:
+                actual_start = bucket_start
+                actual_end = bucket_end
+    
+    meta = result.setdefault("_meta", {})
+    meta.update({
+        "start": actual_start,  # bucket에서 추출한 실제 조회 기간 사용
+        "end": actual_end,      # bucket에서 추출한 실제 조회 기간 사용
+        "timezone": timezone,
+        "timeframe": timeframe,
+        "endpoint_ids": endpoint_ids,
+        "expand": expand
+    })
+    return result
+
+
 class FalAPIClient:
     """fal.ai API 클라이언트"""
     
@@ -99,6 +296,34 @@ class FalAPIClient:
             "Authorization": f"Key {api_key}",
             "Content-Type": "application/json"
         }
+
+        import requests  # type: ignore
+        from requests.adapters import HTTPAdapter  # type: ignore
+        from urllib3.util.retry import Retry  # type: ignore
+
+        # 연결 재사용을 위한 Session (페이지네이션/모델별 호출 간 TLS 핸드셰이크 절약)
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # Rate Limit(429) 및 일시적 서버 오류는 Retry-After/지수 백오프로 재시도
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+
+    def close(self) -> None:
+        """Session 종료 (풀링된 연결 해제)"""
+        self._session.close()
+
+    def __enter__(self) -> "FalAPIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def get_usage(
         self,
@@ -127,6 +352,60 @@ class FalAPIClient:
         Returns:
             API 응답 데이터 (모든 페이지 통합)
         """
+        base_params, expand = self._prepare_query(
+            endpoint_ids, start, end, timeframe, timezone, expand, bound_to_timeframe, include_notion
+        )
+        start_str = base_params["start"]
+        end_str = base_params["end"]
+        timezone = base_params["timezone"]
+        
+        # 모델이 2개 이하일 때는 한 번에 호출, 3개 이상일 때는 개별 호출
+        # (API가 3개 이상의 모델을 한 번에 처리하지 못하는 경우 대비)
+        if len(endpoint_ids) <= 2:
+            return self._get_usage_single(endpoint_ids, base_params, expand, bound_to_timeframe)
+        else:
+            # 각 모델을 개별적으로 동시에 호출하고 결과 합치기
+            # (Rate Limit은 Session의 429 재시도 로직이 처리)
+            max_workers = min(MAX_CONCURRENT_REQUESTS, len(endpoint_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._get_usage_single, [endpoint_id], base_params, expand, bound_to_timeframe)
+                    for endpoint_id in endpoint_ids
+                ]
+                # 모델 순서를 유지하기 위해 제출 순서대로 결과 수집
+                results = [future.result() for future in futures]
+            
+            # summary/time_series 데이터를 한 번에 합치기 (result에서 직접 추출)
+            all_summaries = list(chain.from_iterable(_as_list(r.get("summary")) for r in results))
+            all_time_series = list(chain.from_iterable(_as_list(r.get("time_series")) for r in results))
+            
+            # 최종 응답 구성
+            result = {
+                "summary": all_summaries,
+                "time_series": all_time_series,
+                "next_cursor": None,
+                "has_more": False
+            }
+            
+            return _finalize_result(result, start_str, end_str, timeframe, timezone, endpoint_ids, expand, bound_to_timeframe)
+    
+    def _prepare_query(
+        self,
+        endpoint_ids: List[str],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        timeframe: Optional[str],
+        timezone: Optional[str],
+        expand: Optional[List[str]],
+        bound_to_timeframe: bool,
+        include_notion: bool
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """
+        조회 인자 검증 및 기본값 처리 후 모델과 무관한 공통 파라미터 구성
+        
+        Returns:
+            (공통 파라미터, expand 목록) 튜플
+        """
         if not endpoint_ids:
             raise ValueError("최소 1개의 endpoint_id가 필요합니다.")
         
@@ -145,6 +424,8 @@ class FalAPIClient:
             else:
                 # 일반 조회 시: 요약 데이터만
                 expand = ["summary", "auth_method"]
+        elif isinstance(expand, str):
+            expand = expand.split(",") if expand else []
         
         # 날짜 범위 기본값 처리
         if not start or not end:
@@ -153,227 +434,135 @@ class FalAPIClient:
         # ISO8601 형식으로 변환
         start_str, end_str = date_utils.format_date_range_for_api(start, end, include_time=True)
         
-        # 모델이 2개 이하일 때는 한 번에 호출, 3개 이상일 때는 개별 호출
-        # (API가 3개 이상의 모델을 한 번에 처리하지 못하는 경우 대비)
-        if len(endpoint_ids) <= 2:
-            return self._get_usage_single(endpoint_ids, start_str, end_str, timeframe, timezone, expand, bound_to_timeframe)
-        else:
-            # 각 모델을 개별적으로 호출하고 결과 합치기
-            all_summaries = []
-            all_time_series = []
-            
-            for i, endpoint_id in enumerate(endpoint_ids):
-                result = self._get_usage_single([endpoint_id], start_str, end_str, timeframe, timezone, expand, bound_to_timeframe)
-                
-                # summary 데이터 합치기 (result에서 직접 추출)
-                summary = result.get("summary")
-                if isinstance(summary, list):
-                    all_summaries.extend(summary)
-                elif summary:
-                    all_summaries.append(summary)
-                
-                # time_series 데이터 합치기 (result에서 직접 추출)
-                time_series = result.get("time_series")
-                if isinstance(time_series, list):
-                    all_time_series.extend(time_series)
-                elif time_series:
-                    all_time_series.append(time_series)
-                
-                # Rate Limit 방지를 위해 마지막 호출이 아니면 지연 시간 추가
-                if i < len(endpoint_ids) - 1:
-                    time.sleep(0.5)  # 0.5초 지연
-            
-            # time_series에서 실제 조회 기간 추출 (bound_to_timeframe이 적용된 경우)
-            # bucket은 UTC이므로 사용자 타임존으로 변환
-            actual_start = start_str
-            actual_end = end_str
-            if all_time_series:
-                bucket_start, bucket_end = extract_date_range_from_time_series(
-                    all_time_series, 
-                    timezone, 
-                    timeframe, 
-                    bound_to_timeframe
-                )
-                if bucket_start and bucket_end:
-                    actual_start = bucket_start
-                    actual_end = bucket_end
-            
-            # 최종 응답 구성
-            result = {
-                "summary": all_summaries,
-                "time_series": all_time_series,
-                "next_cursor": None,
-                "has_more": False,
-                "_meta": {
-                    "start": actual_start,  # bucket에서 추출한 실제 조회 기간 사용
-                    "end": actual_end,      # bucket에서 추출한 실제 조회 기간 사용
-                    "timezone": timezone,
-                    "timeframe": timeframe,
-                    "endpoint_ids": endpoint_ids,
-                    "expand": expand if isinstance(expand, list) else expand.split(",") if expand else []
-                }
-            }
-            
-            return result
+        # 모델과 무관한 공통 파라미터는 한 번만 구성 (모델별/페이지별 호출에서 재사용)
+        base_params = {
+            "start": start_str,
+            "end": end_str,
+            "timezone": timezone,
+            "bound_to_timeframe": "true" if bound_to_timeframe else "false",
+            "expand": ",".join(expand)
+        }
+        
+        # timeframe이 지정된 경우만 추가
+        if timeframe:
+            base_params["timeframe"] = timeframe
+        
+        return base_params, expand
     
     def _get_usage_single(
         self,
         endpoint_ids: List[str],
-        start_str: str,
-        end_str: str,
-        timeframe: Optional[str],
-        timezone: str,
+        base_params: Dict[str, str],
         expand: List[str],
         bound_to_timeframe: bool
     ) -> Dict[str, Any]:
-        """단일 API 호출 (내부 메서드)"""
-        # 파라미터 구성
-        params = {
-            "endpoint_id": ",".join(endpoint_ids),  # 쉼표 구분 형식
-            "start": start_str,
-            "end": end_str,
-            "timezone": timezone,
-            "bound_to_timeframe": str(bound_to_timeframe).lower(),
-            "expand": ",".join(expand) if isinstance(expand, list) else expand
-        }
+        """
+        단일 API 호출 (내부 메서드)
         
-        # timeframe이 지정된 경우만 추가
-        if timeframe:
-            params["timeframe"] = timeframe
+        Args:
+            endpoint_ids: 이번 호출에서 조회할 모델 ID 목록
+            base_params: get_usage에서 구성한 공통 파라미터 (start, end, timezone 등, 수정하지 않음)
+            expand: expand 파라미터 목록 (_meta 기록용)
+            bound_to_timeframe: timeframe 경계 정렬 여부
+        """
+        start_str = base_params["start"]
+        end_str = base_params["end"]
+        timezone = base_params["timezone"]
+        timeframe = base_params.get("timeframe")
+        
+        # 과거 기간 조회는 캐시 사용 (캐시 키는 실제 요청 파라미터 기준)
+        cache_key = None
+        if _is_historical(end_str):
+            params = {"endpoint_id": ",".join(endpoint_ids), **base_params}
+            cache_key = _make_cache_key(USAGE_ENDPOINT, params, self.api_key)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        # 첫 번째 요청
         all_data = []
-        cursor = None
-        has_more = True
+        items_key = None
+        items_key_detected = False
         
-        while has_more:
-            # cursor가 있으면 파라미터에 추가
-            if cursor:
-                params["cursor"] = cursor
-            
-            # API 호출 (Rate Limit 재시도 포함)
-            max_retries = 3
-            retry_delay = 1.0  # 초기 재시도 지연 시간 (초)
-            
-            for attempt in range(max_retries):
-                response = requests.get(USAGE_ENDPOINT, headers=self.headers, params=params)
-                
-                # 429 Rate Limit 에러인 경우 재시도
-                if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        # Retry-After 헤더가 있으면 사용, 없으면 지수 백오프
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after:
-                            wait_time = float(retry_after)
-                        else:
-                            wait_time = retry_delay * (2 ** attempt)  # 지수 백오프
-                        
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        # 최대 재시도 횟수 초과
-                        error_msg = f"API 호출 실패: {response.status_code} (Rate Limit, 재시도 횟수 초과)"
-                        try:
-                            error_data = response.json()
-                            if "detail" in error_data:
-                                error_msg += f" - {error_data['detail']}"
-                        except:
-                            error_msg += f" - {response.text}"
-                        raise requests.exceptions.HTTPError(error_msg)
-                
-                # 다른 에러 처리
-                if response.status_code != 200:
-                    error_msg = f"API 호출 실패: {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        if "detail" in error_data:
-                            error_msg += f" - {error_data['detail']}"
-                    except:
-                        error_msg += f" - {response.text}"
-                    raise requests.exceptions.HTTPError(error_msg)
-                
-                # 성공한 경우 루프 종료
-                break
-            
-            data = response.json()
-            
+        for data in self._iter_pages(endpoint_ids, base_params):
             # 데이터 수집
             # 응답 구조에 따라 다를 수 있으므로 유연하게 처리
             if isinstance(data, dict):
-                # items 또는 data 필드가 있는 경우
-                items = data.get("items", data.get("data", []))
+                # items 또는 data 필드가 있는 경우 (필드 이름은 첫 페이지에서 한 번만 판별)
+                if not items_key_detected:
+                    items_key = "items" if "items" in data else ("data" if "data" in data else None)
+                    items_key_detected = True
+                items = data.get(items_key) if items_key else None
                 if items:
                     all_data.extend(items)
                 else:
                     # items가 없으면 전체 응답을 추가
                     all_data.append(data)
-                
-                # 페이지네이션 정보 확인
-                # has_more와 next_cursor는 항상 response에 존재
-                has_more = data.get("has_more", False)
-                
-                # has_more가 true일 때만 next_cursor가 유효한 값
-                # has_more가 false이면 next_cursor는 null
-                if has_more:
-                    cursor = data.get("next_cursor")
-                else:
-                    cursor = None
             else:
                 # 리스트 형식인 경우
                 all_data.extend(data)
-                has_more = False
-                cursor = None
         
-        # 최종 응답 구성
-        # all_data가 비어있거나 리스트인 경우 항상 딕셔너리로 래핑
-        if not all_data:
-            result = {
-                "items": [],
-                "total_count": 0
-            }
-        elif len(all_data) == 1 and isinstance(all_data[0], dict):
-            # 단일 딕셔너리인 경우
-            result = all_data[0]
-            # _meta가 이미 있으면 유지, 없으면 추가
-            if "_meta" not in result:
-                result["_meta"] = {}
-        else:
-            # 여러 항목인 경우 items로 래핑
-            result = {
-                "items": all_data,
-                "total_count": len(all_data)
-            }
+        result = _build_result(all_data)
+        _finalize_result(result, start_str, end_str, timeframe, timezone, endpoint_ids, expand, bound_to_timeframe)
         
-        # time_series에서 실제 조회 기간 추출 (bound_to_timeframe이 적용된 경우)
-        # bucket은 UTC이므로 사용자 타임존으로 변환
-        actual_start = start_str
-        actual_end = end_str
-        time_series = result.get("time_series", [])
-        if time_series:
-            bucket_start, bucket_end = extract_date_range_from_time_series(
-                time_series, 
-                timezone, 
-                timeframe, 
-                bound_to_timeframe
-            )
-            if bucket_start and bucket_end:
-                actual_start = bucket_start
-                actual_end = bucket_end
-        
-        # 메타데이터 추가/업데이트
-        if "_meta" not in result:
-            result["_meta"] = {}
-        result["_meta"].update({
-            "start": actual_start,  # bucket에서 추출한 실제 조회 기간 사용
-            "end": actual_end,      # bucket에서 추출한 실제 조회 기간 사용
-            "timezone": timezone,
-            "timeframe": timeframe,
-            "endpoint_ids": endpoint_ids,
-            "expand": expand if isinstance(expand, list) else expand.split(",") if expand else []
-        })
+        if cache_key:
+            _response_cache.set(cache_key, result, USAGE_CACHE_TTL)
         
         return result
     
+    def _iter_pages(
+        self,
+        endpoint_ids: List[str],
+        base_params: Dict[str, str]
+    ) -> Iterator[Any]:
+        """
+        cursor 기반 페이지네이션을 따라가며 각 페이지 응답을 반환 (내부 메서드)
+        
+        Args:
+            endpoint_ids: 이번 호출에서 조회할 모델 ID 목록
+            base_params: 공통 파라미터 (수정하지 않음)
+        
+        Yields:
+            파싱된 페이지 응답 (딕셔너리 또는 리스트)
+        """
+        # 파라미터 구성 (공통 파라미터는 공유되므로 복사본에 모델 ID 추가)
+        params = {"endpoint_id": ",".join(endpoint_ids), **base_params}  # 쉼표 구분 형식
+        
+        # 고정 파라미터의 쿼리 문자열은 한 번만 인코딩하고 페이지마다 cursor만 덧붙임
+        base_url = f"{USAGE_ENDPOINT}?{urlencode(params)}"
+        cursor = None
+        
+        while True:
+            # cursor가 있으면 파라미터에 추가
+            page_url = f"{base_url}&cursor={quote_plus(cursor)}" if cursor else base_url
+            
+            # API 호출 (429/5xx 재시도는 Session의 HTTPAdapter가 처리)
+            response = self._session.get(page_url)
+            
+            if response.status_code != 200:
+                error_msg = f"API 호출 실패: {response.status_code}"
+                if response.status_code == 429:
+                    error_msg += " (Rate Limit, 재시도 횟수 초과)"
+                try:
+                    error_data = response.json()
+                    if "detail" in error_data:
+                        error_msg += f" - {error_data['detail']}"
+                except:
+                    error_msg += f" - {response.text}"
+                import requests  # type: ignore
+                raise requests.exceptions.HTTPError(error_msg)
+            
+            data = _parse_json(response)
+            yield data
+            
+            # 페이지네이션 정보 확인 (리스트 형식이면 단일 페이지)
+            # has_more가 true일 때만 next_cursor가 유효한 값
+            if not isinstance(data, dict) or not data.get("has_more", False):
+                break
+            cursor = data.get("next_cursor")
+            if not cursor:
+                # has_more인데 cursor가 없으면 첫 페이지를 반복 조회하게 되므로 중단
+                break
+    
     def get_pricing(
         self,
         endpoint_ids: Optional[List[str]] = None
@@ -393,7 +582,12 @@ class FalAPIClient:
         if endpoint_ids:
             params["endpoint_id"] = ",".join(endpoint_ids)
         
-        response = requests.get(pricing_endpoint, headers=self.headers, params=params)
+        cache_key = _make_cache_key(pricing_endpoint, params, self.api_key)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        response = self._session.get(pricing_endpoint, params=params)
         
         if response.status_code != 200:
             error_msg = f"Pricing API 호출 실패: {response.status_code}"
@@ -403,6 +597,9 @@ class FalAPIClient:
                     error_msg += f" - {error_data['detail']}"
             except:
                 error_msg += f" - {response.text}"
+            import requests  # type: ignore
             raise requests.exceptions.HTTPError(error_msg)
         
-        return response.json()
\ No newline at end of file
+        pricing_data = _parse_json(response)
+        _response_cache.set(cache_key, pricing_data, PRICING_CACHE_TTL)
+        return pricing_data
\ No newline at end of file
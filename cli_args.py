@@ -3,11 +3,18 @@ CLI 인자 파싱 모듈
 argparse를 사용한 명령줄 인자 정의 및 파싱
 """
 import argparse
+from functools import lru_cache
 import config
 
 
-def parse_args() -> argparse.Namespace:
-    """CLI 인자 파싱"""
+def str_to_bool(value: str) -> bool:
+    """문자열 옵션 값을 bool로 변환 (true, 1, yes → True)"""
+    return value.lower() in ["true", "1", "yes"]
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """ArgumentParser 구성 (한 번만 생성하여 재사용)"""
     parser = argparse.ArgumentParser(
         description="fal.ai 사용량 추적 CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -70,7 +77,7 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument(
         "-bound-to-timeframe",
-        type=lambda x: x.lower() in ["true", "1", "yes"],
+        type=str_to_bool,
         default=True,
         help="timeframe 경계 정렬 활성화 (기본값: true)"
     )
@@ -115,4 +122,9 @@ def parse_args() -> argparse.Namespace:
         help="Notion에 중복 데이터가 있으면 업데이트 (기본값: 중복 시 스킵)"
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    return _build_parser().parse_args()
@@ -3,49 +3,325 @@ CLI 인터랙티브 메뉴 모듈
 사용자 인터페이스 및 메뉴 관리
 """
 import sys
+import time
 import argparse
-from typing import Optional, Dict, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt
-from rich import box
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Callable, Tuple, FrozenSet
 import config
-import date_utils
 
+# rich는 import 비용이 크므로 메뉴를 실제로 그리는 시점에 import
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Rich console 인스턴스 (첫 사용 시 생성)
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Rich console 인스턴스 반환 (최초 호출 시 rich import 및 생성)"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# 메뉴 제목/구분선 마크업
+_SEP = "[dim]" + "─" * 50 + "[/dim]"
+_TITLE_MODELS = "[bold cyan]📦 모델 관리[/bold cyan]"
+_TITLE_ADD_MODEL = "[bold cyan]➕ 모델 추가[/bold cyan]"
+_TITLE_DELETE_MODEL = "[bold yellow]➖ 모델 삭제[/bold yellow]"
+_TITLE_DATE_RANGE = "[bold magenta]📅 날짜 범위 설정[/bold magenta]"
+_TITLE_PRESET = "[bold magenta]📅 프리셋 선택[/bold magenta]"
+_TITLE_CUSTOM_DATE = "[bold magenta]📅 날짜 범위 직접 입력[/bold magenta]"
+_TITLE_API_KEY = "[bold green]🔑 API 키 설정[/bold green]"
+_TITLE_NOTION_SAVE = "[bold yellow]💾 Notion 저장 옵션[/bold yellow]"
+_TITLE_NOTION = "[bold blue]📝 Notion 설정[/bold blue]"
+
+# 날짜 프리셋 표시 이름 / 선택 번호별 프리셋
+_PRESET_NAMES = {
+    "today": "오늘",
+    "yesterday": "어제",
+    "last-7-days": "최근 7일",
+    "last-30-days": "최근 30일",
+    "this-month": "이번 달"
+}
+_PRESETS = {
+    "1": "today",
+    "2": "yesterday",
+    "3": "last-7-days",
+    "4": "last-30-days",
+    "5": "this-month"
+}
+
+# 메뉴 옵션 행 (번호, 표시 텍스트) - 상태에 따라 달라지는 메뉴는 두 가지를 미리 구성
+_MAIN_MENU_ROWS = (
+    ("1", "모델 관리"),
+    ("2", "날짜 범위 설정"),
+    ("3", "API 키 설정"),
+    ("4", "Notion 설정 [dim](API 키, 데이터베이스)[/dim]"),
+    ("5", "Notion 저장 옵션 [dim](저장, 업데이트)[/dim]"),
+    ("6", "[bold green]조회 실행[/bold green]"),
+    ("7", "[dim]종료[/dim]"),
+)
+_MODEL_MENU_ROWS = (
+    ("1", "모델 추가"),
+    ("2", "모델 삭제"),
+    ("3", "뒤로 가기"),
+)
+_MODEL_MENU_ROWS_EMPTY = (
+    ("1", "모델 추가"),
+    ("2", "[dim]모델 삭제[/dim]"),
+    ("3", "뒤로 가기"),
+)
+_DATE_MENU_ROWS = (
+    ("1", "프리셋 선택 [dim](오늘, 어제, 최근 7일 등)[/dim]"),
+    ("2", "시작/종료 날짜 직접 입력"),
+    ("3", "뒤로 가기"),
+)
+_PRESET_MENU_ROWS = (
+    ("1", "오늘 (today)"),
+    ("2", "어제 (yesterday)"),
+    ("3", "최근 7일 (last-7-days)"),
+    ("4", "최근 30일 (last-30-days)"),
+    ("5", "이번 달 (this-month)"),
+    ("6", "취소"),
+)
+_API_KEY_MENU_ROWS = (
+    ("1", "API 키 입력/변경"),
+    ("2", "뒤로 가기"),
+)
+_NOTION_MENU_ROWS = (
+    ("1", "Notion API 키 입력/변경"),
+    ("2", "데이터베이스 ID 추가/수정"),
+    ("3", "데이터베이스 ID 삭제"),
+    ("4", "뒤로 가기"),
+)
+_NOTION_MENU_ROWS_EMPTY = (
+    ("1", "Notion API 키 입력/변경"),
+    ("2", "데이터베이스 ID 추가/수정"),
+    ("3", "[dim]데이터베이스 ID 삭제[/dim]"),
+    ("4", "뒤로 가기"),
+)
+
+# 번호 목록을 나눠 출력할 때 한 번에 출력할 행 수
+_LIST_PAGE_SIZE = 50
+
+# 자주 쓰는 프롬프트/상태 문구
+_PROMPT_SELECT = "\n[cyan]선택[/cyan]"
+_NO_API_KEY = "[dim]등록된 API 키 없음[/dim]"
+
+# 메뉴 선택지 (입력 검증은 frozenset 조회)
+_CHOICES_1_2 = frozenset("12")
+_CHOICES_1_3 = frozenset("123")
+_CHOICES_1_4 = frozenset("1234")
+_CHOICES_1_6 = frozenset("123456")
+_CHOICES_1_7 = frozenset("1234567")
+
+
+@lru_cache(maxsize=32)
+def _choice_prompt(prompt: str, choices: FrozenSet[str]) -> str:
+    """선택지 목록이 붙은 프롬프트 문자열 생성"""
+    return f"{prompt} [bold magenta]\\[{'/'.join(sorted(choices))}][/bold magenta]: "
+
+
+@lru_cache(maxsize=8)
+def _mask(key: str) -> str:
+    """API 키/ID 마스킹 (앞 8자리 + ... + 뒤 4자리)"""
+    return key[:8] + "..." + key[-4:] if len(key) > 12 else "***"
+
+
+@lru_cache(maxsize=32)
+def _cached_range(
+    preset: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    tz: str,
+    minute: int
+) -> Tuple[str, str]:
+    """
+    메뉴 표시용 날짜 범위 문자열 (같은 입력이면 재계산하지 않음)
+    
+    종료 시점이 현재 시간인 경우가 있으므로 minute(현재 분)을 키에 포함하여 1분 단위로 갱신
+    (시작/종료 날짜가 모두 지정된 범위는 현재 시간과 무관하므로 호출 측에서 minute=0으로 고정)
+    """
+    import date_utils
+
+    start, end = date_utils.parse_date_range(
+        preset=preset,
+        start_date=start_date,
+        end_date=end_date,
+        tz=tz
+    )
+    return start.strftime("%Y-%m-%d %H:%M:%S"), end.strftime("%Y-%m-%d %H:%M:%S")
 
-# Rich console 인스턴스
-console = Console()
 
+@lru_cache(maxsize=8)
+def _key_status(key: Optional[str]) -> str:
+    """API 키 표시용 마크업 (마스킹된 키 또는 미등록 문구)"""
+    return f"[green]{_mask(key)}[/green]" if key else _NO_API_KEY
 
-def show_main_menu() -> int:
-    """메인 메뉴 표시"""
-    console.print()
 
-    # 메뉴 테이블 생성
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("번호", style="bold cyan", width=4)
-    table.add_column("메뉴", style="white")
-
-    table.add_row("1", "모델 관리")
-    table.add_row("2", "날짜 범위 설정")
-    table.add_row("3", "API 키 설정")
-    table.add_row("4", "Notion 설정 [dim](API 키, 데이터베이스)[/dim]")
-    table.add_row("5", "Notion 저장 옵션 [dim](저장, 업데이트)[/dim]")
-    table.add_row("6", "[bold green]조회 실행[/bold green]")
-    table.add_row("7", "[dim]종료[/dim]")
-
-    panel = Panel(
-        table,
+def _ask(prompt: str, choices: FrozenSet[str]) -> str:
+    """
+    선택지 중 하나를 입력받을 때까지 반복 (Rich Prompt 대신 input + frozenset 검증)
+    
+    Raises:
+        KeyboardInterrupt: Ctrl+C 또는 입력 종료(EOF) 시
+    """
+    console = _get_console()
+    text = _choice_prompt(prompt, choices)
+    while True:
+        try:
+            value = console.input(text).strip()
+        except EOFError:
+            raise KeyboardInterrupt
+        if value in choices:
+            return value
+        console.print("[red]목록에 있는 선택지를 입력하세요.[/red]")
+
+
+# 내용이 고정된 메뉴 renderable 캐시 (키: 메뉴 이름 + 동적 입력값)
+_renderable_cache: Dict[Any, Any] = {}
+
+
+def _get_cached_renderable(key: Any, build: Callable[[], Any]) -> Any:
+    """정적 메뉴 renderable을 한 번만 생성하여 재사용"""
+    renderable = _renderable_cache.get(key)
+    if renderable is None:
+        renderable = _renderable_cache[key] = build()
+    return renderable
+
+
+def _print_group(*renderables: Any) -> None:
+    """여러 renderable을 Group으로 묶어 한 번의 print로 출력 ("" 항목은 빈 줄)"""
+    from rich.console import Group
+    _get_console().print(Group(*renderables))
+
+
+def _print_indexed_list(
+    items: List[str],
+    header_style: str,
+    number_style: str,
+    header: Tuple[Any, ...] = (),
+    footer: Tuple[Any, ...] = (),
+    page_size: int = _LIST_PAGE_SIZE
+) -> None:
+    """
+    번호/모델 ID 목록을 page_size 행씩 나눠 출력 (긴 목록도 전체 행을 한꺼번에 만들지 않음)
+    
+    header는 첫 페이지, footer는 마지막 페이지와 함께 한 번에 출력하므로
+    목록이 한 페이지 이내이면 화면 전체가 print 한 번으로 출력됨
+    
+    Args:
+        items: 출력할 항목 목록
+        header_style: 목록 헤더 줄 스타일
+        number_style: 번호 스타일
+        header: 목록 앞에 출력할 renderable
+        footer: 목록 뒤에 출력할 renderable
+        page_size: 한 번에 출력할 최대 행 수
+    """
+    last_start = max(len(items) - 1, 0) // page_size * page_size
+    for page_start in range(0, len(items), page_size):
+        page = tuple(items[page_start:page_start + page_size])
+        _print_group(
+            *(header if page_start == 0 else ()),
+            *((_indexed_header(header_style),) if page_start == 0 else ()),
+            _indexed_lines(page, page_start, number_style),
+            *(footer if page_start == last_start else ())
+        )
+
+
+@lru_cache(maxsize=8)
+def _indexed_header(style: str) -> Any:
+    """번호 목록의 헤더 줄 (번호/모델 ID)"""
+    from rich.text import Text
+    return Text.from_markup(f"[bold {style}]  번호  모델 ID[/bold {style}]")
+
+
+@lru_cache(maxsize=32)
+def _indexed_lines(items: Tuple[str, ...], start: int, number_style: str) -> Any:
+    """
+    번호 목록 한 페이지를 미리 포맷한 Text로 생성 (Table 레이아웃 계산 없이 출력)
+    
+    Args:
+        items: 페이지에 포함된 항목
+        start: 페이지 첫 항목의 0 기준 인덱스
+        number_style: 번호 스타일
+    """
+    from rich.text import Text
+
+    # 긴 모델 ID도 잘리지 않도록 폭을 넘으면 다음 줄로 접어서 표시
+    text = Text(overflow="fold")
+    for number, item in enumerate(items, start + 1):
+        if number > start + 1:
+            text.append("\n")
+        text.append(f"  {number:<6}", style=number_style)
+        text.append(item, style="white")
+    return text
+
+
+def _separator() -> Any:
+    """구분선 Text 반환 (마크업은 최초 1회만 파싱)"""
+    def build() -> Any:
+        from rich.text import Text
+        return Text.from_markup(_SEP)
+
+    return _get_cached_renderable("separator", build)
+
+
+@lru_cache(maxsize=16)
+def _header(title_markup: str) -> Tuple[Any, ...]:
+    """메뉴 상단 공통 영역 (빈 줄, 제목, 구분선, 빈 줄)"""
+    return ("", _title(title_markup), _separator(), "")
+
+
+def _title(markup: str) -> Any:
+    """메뉴 제목 Text 반환 (마크업은 제목별로 최초 1회만 파싱)"""
+    def build() -> Any:
+        from rich.text import Text
+        return Text.from_markup(markup)
+
+    return _get_cached_renderable(("title", markup), build)
+
+
+def _get_menu_table(rows: Tuple[Tuple[str, str], ...], label: str = "메뉴") -> Any:
+    """번호/메뉴 2열 옵션 테이블 반환 (같은 행 구성이면 캐시된 테이블 재사용)"""
+    def build() -> Any:
+        from rich.table import Table
+
+        table = Table(show_header=False, box=None, padding=(0, 2))
+        table.add_column("번호", style="bold cyan", width=4)
+        table.add_column(label, style="white")
+        for number, text in rows:
+            table.add_row(number, text)
+        return table
+
+    return _get_cached_renderable(("menu_table", label, rows), build)
+
+
+def _build_main_menu_panel() -> Any:
+    """메인 메뉴 패널 생성"""
+    from rich.panel import Panel
+
+    return Panel(
+        _get_menu_table(_MAIN_MENU_ROWS),
         title="[bold blue]🚀 fal.ai 사용량 추적 CLI[/bold blue]",
         border_style="blue",
         padding=(0, 1)
     )
-    console.print(panel)
+
+
+def show_main_menu() -> int:
+    """메인 메뉴 표시"""
+    console = _get_console()
+
+    _print_group("", _get_cached_renderable("main_menu", _build_main_menu_panel))
 
     while True:
         try:
-            choice = Prompt.ask("\n[cyan]메뉴 선택[/cyan]", choices=["1", "2", "3", "4", "5", "6", "7"])
+            choice = _ask("\n[cyan]메뉴 선택[/cyan]", _CHOICES_1_7)
             return int(choice)
         except KeyboardInterrupt:
             console.print("\n[yellow]프로그램을 종료합니다.[/yellow]")
@@ -56,139 +332,160 @@ def show_main_menu() -> int:
 
 def show_model_menu() -> None:
     """모델 관리 메뉴"""
+    console = _get_console()
+
+    # 모델 목록은 추가/삭제 시에만 바뀌므로 루프마다 다시 읽지 않음
+    models = config.get_models()
     while True:
-        models = config.get_models()
-        console.print()
-        console.print("[bold cyan]📦 모델 관리[/bold cyan]")
-        console.print("[dim]" + "─" * 50 + "[/dim]")
-        console.print()
+        # 메뉴 옵션
+        menu_table = _get_menu_table(_MODEL_MENU_ROWS if models else _MODEL_MENU_ROWS_EMPTY)
 
         # 현재 모델 목록
         if models:
             status = f"[green]등록된 모델: {len(models)}개[/green]"
-            console.print(status)
-            console.print()
-
-            model_table = Table(show_header=True, box=box.SIMPLE, border_style="green")
-            model_table.add_column("번호", style="cyan", width=6)
-            model_table.add_column("모델 ID", style="white")
-
-            for i, model in enumerate(models, 1):
-                model_table.add_row(str(i), model)
-
-            console.print(model_table)
+            _print_indexed_list(
+                models,
+                header_style="green",
+                number_style="cyan",
+                header=(*_header(_TITLE_MODELS), status, ""),
+                footer=("", menu_table)
+            )
         else:
-            console.print("[dim]등록된 모델이 없습니다.[/dim]")
-
-        console.print()
-
-        # 메뉴 옵션
-        menu_table = Table(show_header=False, box=None, padding=(0, 2))
-        menu_table.add_column("번호", style="bold cyan", width=4)
-        menu_table.add_column("메뉴", style="white")
-
-        menu_table.add_row("1", "모델 추가")
-        menu_table.add_row("2", "모델 삭제" if models else "[dim]모델 삭제[/dim]")
-        menu_table.add_row("3", "뒤로 가기")
-
-        console.print(menu_table)
+            _print_group(
+                *_header(_TITLE_MODELS),
+                "[dim]등록된 모델이 없습니다.[/dim]", "", menu_table
+            )
 
         try:
-            choice = Prompt.ask("\n[cyan]선택[/cyan]", choices=["1", "2", "3"])
-            if choice == "1":
-                add_model()
-            elif choice == "2":
-                if models:
-                    delete_model()
-                else:
-                    console.print("[yellow]삭제할 모델이 없습니다.[/yellow]")
-            elif choice == "3":
+            action = _MODEL_MENU_ACTIONS.get(_ask(_PROMPT_SELECT, _CHOICES_1_3))
+            if action is None:
                 break
+            models = action(models)
         except KeyboardInterrupt:
             break
         except Exception as e:
             console.print(f"[red]오류: {e}[/red]")
 
 
-def add_model() -> None:
-    """모델 추가"""
-    console.print()
-    console.print("[bold cyan]➕ 모델 추가[/bold cyan]")
-    console.print("[dim]" + "─" * 50 + "[/dim]")
-    console.print()
-    console.print("[dim]예: fal-ai/imagen4/preview/ultra[/dim]")
+def _delete_model_if_any(models: List[str]) -> List[str]:
+    """모델이 있을 때만 삭제 메뉴 진입"""
+    if models:
+        return delete_model(models)
+    _get_console().print("[yellow]삭제할 모델이 없습니다.[/yellow]")
+    return models
+
+
+def add_model(models: Optional[List[str]] = None) -> List[str]:
+    """
+    모델 추가
+    
+    Args:
+        models: 현재 모델 목록 (None이면 config에서 읽음)
+    
+    Returns:
+        추가 후 모델 목록
+    """
+    from rich.prompt import Prompt
+    console = _get_console()
+
+    _print_group(*_header(_TITLE_ADD_MODEL), "[dim]예: fal-ai/imagen4/preview/ultra[/dim]")
+
+    if models is None:
+        models = config.get_models()
 
     model_id = Prompt.ask("[cyan]모델 ID[/cyan]").strip()
 
     if not model_id:
         console.print("[red]모델 ID를 입력해주세요.[/red]")
-        return
+        return models
 
-    models = config.get_models()
     if model_id in models:
         console.print(f"[yellow]'{model_id}'는 이미 등록되어 있습니다.[/yellow]")
-        return
+        return models
 
-    models.append(model_id)
+    models = [*models, model_id]
     config.save_models(models)
     console.print(f"[green]✓ '{model_id}'가 추가되었습니다.[/green]")
-
-
-def delete_model() -> None:
-    """모델 삭제"""
-    models = config.get_models()
+    return models
+
+
+def delete_model(models: Optional[List[str]] = None) -> List[str]:
+    """
+    모델 삭제
+    
+    Args:
+        models: 현재 모델 목록 (None이면 config에서 읽음)
+    
+    Returns:
+        삭제 후 모델 목록
+    """
+    console = _get_console()
+
+    if models is None:
+        models = config.get_models()
     if not models:
         console.print("[yellow]삭제할 모델이 없습니다.[/yellow]")
-        return
-
-    console.print()
-    console.print("[bold yellow]➖ 모델 삭제[/bold yellow]")
-    console.print("[dim]" + "─" * 50 + "[/dim]")
-    console.print()
+        return models
 
     # 모델 목록 표시
-    table = Table(show_header=True, box=box.SIMPLE, border_style="yellow")
-    table.add_column("번호", style="yellow", width=6)
-    table.add_column("모델 ID", style="white")
+    _print_indexed_list(
+        models,
+        header_style="yellow",
+        number_style="yellow",
+        header=_header(_TITLE_DELETE_MODEL)
+    )
 
-    for i, model in enumerate(models, 1):
-        table.add_row(str(i), model)
+    try:
+        # 선택지 목록을 만들지 않고 범위로 직접 검증 (0은 취소)
+        count = len(models)
+        while True:
+            raw = console.input("\n[yellow]삭제할 모델 번호[/yellow] [dim](취소: 0)[/dim]: ").strip()
+            if raw.isdecimal() and int(raw) <= count:
+                break
+            console.print(f"[red]0~{count} 사이의 번호를 입력하세요.[/red]")
 
-    console.print(table)
+        index = int(raw) - 1
+        if index < 0:
+            console.print("[dim]삭제를 취소했습니다.[/dim]")
+            return models
 
-    try:
-        choice = Prompt.ask("\n[yellow]삭제할 모델 번호[/yellow]", choices=[str(i) for i in range(1, len(models) + 1)])
-        deleted = models.pop(int(choice) - 1)
-        config.save_models(models)
+        deleted = models[index]
+        remaining = models[:index] + models[index + 1:]
+        config.save_models(remaining)
         console.print(f"[green]✓ '{deleted}'가 삭제되었습니다.[/green]")
+        return remaining
     except Exception as e:
         console.print(f"[red]오류: {e}[/red]")
+        return models
 
 
 def show_date_range_menu(args: argparse.Namespace) -> Dict[str, Any]:
     """날짜 범위 설정 메뉴"""
+    from rich.table import Table
+    console = _get_console()
+
     date_settings = {
         "preset": None,
         "start_date": None,
         "end_date": None
     }
 
+    # args는 이 메뉴에서 바뀌지 않으므로 (변경 시 바로 반환) 타임존/범위 종류는 한 번만 결정
+    tz = args.timezone or config.get_timezone()
+    fixed_range = not args.preset and args.start_date and args.end_date
+
     while True:
-        console.print()
-        console.print("[bold magenta]📅 날짜 범위 설정[/bold magenta]")
-        console.print("[dim]" + "─" * 50 + "[/dim]")
-        console.print()
+        parts = list(_header(_TITLE_DATE_RANGE))
 
         # 현재 설정 및 실제 날짜 범위 표시
         try:
-            start, end = date_utils.parse_date_range(
-                preset=args.preset,
-                start_date=args.start_date,
-                end_date=args.end_date,
-                tz=args.timezone or config.get_timezone()
+            start_display, end_display = _cached_range(
+                args.preset,
+                args.start_date,
+                args.end_date,
+                tz,
+                0 if fixed_range else int(time.time() // 60)
             )
-            start_display = start.strftime("%Y-%m-%d %H:%M:%S")
-            end_display = end.strftime("%Y-%m-%d %H:%M:%S")
 
             # 현재 설정 정보
             info_table = Table(show_header=False, box=None, padding=(0, 1))
@@ -196,14 +493,7 @@ def show_date_range_menu(args: argparse.Namespace) -> Dict[str, Any]:
             info_table.add_column("값", style="white")
 
             if args.preset:
-                preset_names = {
-                    "today": "오늘",
-                    "yesterday": "어제",
-                    "last-7-days": "최근 7일",
-                    "last-30-days": "최근 30일",
-                    "this-month": "이번 달"
-                }
-                preset_name = preset_names.get(args.preset, args.preset)
+                preset_name = _PRESET_NAMES.get(args.preset, args.preset)
                 info_table.add_row("현재 설정", f"[green]{preset_name}[/green]")
             elif args.start_date:
                 end_desc = args.end_date if args.end_date else "현재"
@@ -213,26 +503,17 @@ def show_date_range_menu(args: argparse.Namespace) -> Dict[str, Any]:
 
             info_table.add_row("실제 범위", f"[yellow]{start_display}[/yellow]\n[yellow]~ {end_display}[/yellow]")
 
-            console.print(info_table)
+            parts.append(info_table)
 
         except Exception as e:
-            console.print(f"[red]오류: {e}[/red]")
-
-        console.print()
+            parts.append(f"[red]오류: {e}[/red]")
 
         # 메뉴 옵션
-        menu_table = Table(show_header=False, box=None, padding=(0, 2))
-        menu_table.add_column("번호", style="bold cyan", width=4)
-        menu_table.add_column("메뉴", style="white")
-
-        menu_table.add_row("1", "프리셋 선택 [dim](오늘, 어제, 최근 7일 등)[/dim]")
-        menu_table.add_row("2", "시작/종료 날짜 직접 입력")
-        menu_table.add_row("3", "뒤로 가기")
-
-        console.print(menu_table)
+        parts += ["", _get_menu_table(_DATE_MENU_ROWS)]
+        _print_group(*parts)
 
         try:
-            choice = Prompt.ask("\n[cyan]선택[/cyan]", choices=["1", "2", "3"])
+            choice = _ask(_PROMPT_SELECT, _CHOICES_1_3)
             if choice == "1":
                 preset = select_preset()
                 if preset:
@@ -257,37 +538,13 @@ def show_date_range_menu(args: argparse.Namespace) -> Dict[str, Any]:
 
 def select_preset() -> Optional[str]:
     """프리셋 선택"""
-    console.print()
-    console.print("[bold magenta]📅 프리셋 선택[/bold magenta]")
-    console.print("[dim]" + "─" * 50 + "[/dim]")
-    console.print()
-
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("번호", style="bold cyan", width=4)
-    table.add_column("프리셋", style="white")
-
-    table.add_row("1", "오늘 (today)")
-    table.add_row("2", "어제 (yesterday)")
-    table.add_row("3", "최근 7일 (last-7-days)")
-    table.add_row("4", "최근 30일 (last-30-days)")
-    table.add_row("5", "이번 달 (this-month)")
-    table.add_row("6", "취소")
-
-    console.print(table)
-
-    presets = {
-        "1": "today",
-        "2": "yesterday",
-        "3": "last-7-days",
-        "4": "last-30-days",
-        "5": "this-month"
-    }
+    _print_group(*_header(_TITLE_PRESET), _get_menu_table(_PRESET_MENU_ROWS, label="프리셋"))
 
     try:
-        choice = Prompt.ask("\n[cyan]선택[/cyan]", choices=["1", "2", "3", "4", "5", "6"])
+        choice = _ask(_PROMPT_SELECT, _CHOICES_1_6)
         if choice == "6":
             return None
-        return presets.get(choice)
+        return _PRESETS.get(choice)
     except KeyboardInterrupt:
         return None
     except Exception:
@@ -296,11 +553,10 @@ def select_preset() -> Optional[str]:
 
 def input_custom_date_range() -> tuple[Optional[str], Optional[str]]:
     """사용자 정의 날짜 범위 입력"""
-    console.print()
-    console.print("[bold magenta]📅 날짜 범위 직접 입력[/bold magenta]")
-    console.print("[dim]" + "─" * 50 + "[/dim]")
-    console.print()
-    console.print("[dim]형식: YYYY-MM-DD[/dim]")
+    from rich.prompt import Prompt
+    console = _get_console()
+
+    _print_group(*_header(_TITLE_CUSTOM_DATE), "[dim]형식: YYYY-MM-DD[/dim]")
 
     try:
         start = Prompt.ask("[cyan]시작 날짜[/cyan]").strip()
@@ -318,19 +574,13 @@ def input_custom_date_range() -> tuple[Optional[str], Optional[str]]:
 
 def show_api_key_menu() -> None:
     """API 키 설정 메뉴"""
+    from rich.table import Table
+    console = _get_console()
+
+    # 저장 시에만 바뀌므로 루프 밖에서 한 번만 읽음
+    api_key = config.get_api_key()
     while True:
-        console.print()
-        console.print("[bold green]🔑 API 키 설정[/bold green]")
-        console.print("[dim]" + "─" * 50 + "[/dim]")
-        console.print()
-
-        api_key = config.get_api_key()
-        if api_key:
-            # 마스킹 처리
-            masked_key = api_key[:8] + "..." + api_key[-4:] if len(api_key) > 12 else "***"
-            status = f"[green]{masked_key}[/green]"
-        else:
-            status = "[dim]등록된 API 키 없음[/dim]"
+        status = _key_status(api_key)
 
         # 현재 설정 및 메뉴
         info_table = Table(show_header=False, box=None, padding=(0, 1))
@@ -338,44 +588,45 @@ def show_api_key_menu() -> None:
         info_table.add_column("값", style="white")
         info_table.add_row("현재 API 키", status)
 
-        console.print(info_table)
-        console.print()
-
         # 메뉴 옵션
-        menu_table = Table(show_header=False, box=None, padding=(0, 2))
-        menu_table.add_column("번호", style="bold cyan", width=4)
-        menu_table.add_column("메뉴", style="white")
-        menu_table.add_row("1", "API 키 입력/변경")
-        menu_table.add_row("2", "뒤로 가기")
-
-        console.print(menu_table)
+        menu_table = _get_menu_table(_API_KEY_MENU_ROWS)
+        _print_group(*_header(_TITLE_API_KEY), info_table, "", menu_table)
 
         try:
-            choice = Prompt.ask("\n[cyan]선택[/cyan]", choices=["1", "2"])
-            if choice == "1":
-                console.print()
-                api_key = Prompt.ask("[cyan]fal.ai Admin API 키[/cyan]").strip()
-                if api_key:
-                    config.save_api_key(api_key)
-                    console.print("[green]✓ API 키가 저장되었습니다.[/green]")
-                else:
-                    console.print("[red]API 키를 입력해주세요.[/red]")
-            elif choice == "2":
+            action = _API_KEY_MENU_ACTIONS.get(_ask(_PROMPT_SELECT, _CHOICES_1_2))
+            if action is None:
                 break
+            api_key = action(api_key)
         except KeyboardInterrupt:
             break
         except Exception as e:
             console.print(f"[red]오류: {e}[/red]")
 
 
+def _input_api_key(api_key: Optional[str]) -> Optional[str]:
+    """fal.ai API 키 입력 및 저장 (저장 후 현재 API 키 반환)"""
+    from rich.prompt import Prompt
+    console = _get_console()
+
+    console.print()
+    new_api_key = Prompt.ask("[cyan]fal.ai Admin API 키[/cyan]").strip()
+    if not new_api_key:
+        console.print("[red]API 키를 입력해주세요.[/red]")
+        return api_key
+
+    config.save_api_key(new_api_key)
+    # "저장되었습니다" 메시지 전에 파일에 기록 (모델 추가/삭제는 메뉴를 나갈 때 한 번에 기록)
+    config.flush_config()
+    console.print("[green]✓ API 키가 저장되었습니다.[/green]")
+    return new_api_key
+
+
 def show_notion_save_menu(args: argparse.Namespace) -> None:
     """Notion 저장 옵션 메뉴"""
-    while True:
-        console.print()
-        console.print("[bold yellow]💾 Notion 저장 옵션[/bold yellow]")
-        console.print("[dim]" + "─" * 50 + "[/dim]")
-        console.print()
+    from rich.table import Table
+    console = _get_console()
 
+    while True:
         # 현재 모드 결정
         if args.notion:
             save_status = "[green]●[/green] 활성화"
@@ -394,9 +645,6 @@ def show_notion_save_menu(args: argparse.Namespace) -> None:
         status_table.add_row("저장 모드", save_status)
         status_table.add_row("중복 데이터 처리", update_status)
 
-        console.print(status_table)
-        console.print()
-
         # 메뉴 옵션
         menu_table = Table(show_header=False, box=None, padding=(0, 2))
         menu_table.add_column("", width=3)
@@ -409,48 +657,51 @@ def show_notion_save_menu(args: argparse.Namespace) -> None:
         menu_table.add_row("", "3", f"중복 데이터 업데이트 ON/OFF [dim](현재: {update_status})[/dim]")
         menu_table.add_row("", "4", "뒤로 가기")
 
-        console.print(menu_table)
+        _print_group(*_header(_TITLE_NOTION_SAVE), status_table, "", menu_table)
 
         try:
-            choice = Prompt.ask("\n[cyan]선택[/cyan]", choices=["1", "2", "3", "4"])
-            if choice == "1":
-                args.notion = False
-                args.dry_run = False
-                console.print("[green]✓ Notion 저장이 비활성화되었습니다.[/green]")
-            elif choice == "2":
-                args.notion = True
-                args.dry_run = False
-                console.print("[green]✓ Notion 저장이 활성화되었습니다.[/green]")
-            elif choice == "3":
-                args.update_existing = not args.update_existing
-                status = "활성화" if args.update_existing else "비활성화"
-                console.print(f"[green]✓ 중복 데이터 업데이트가 {status}되었습니다.[/green]")
-            elif choice == "4":
+            action = _NOTION_SAVE_MENU_ACTIONS.get(_ask(_PROMPT_SELECT, _CHOICES_1_4))
+            if action is None:
                 break
+            action(args)
         except KeyboardInterrupt:
             break
         except Exception as e:
             console.print(f"[red]오류: {e}[/red]")
 
 
+def _disable_notion_save(args: argparse.Namespace) -> None:
+    """Notion 저장 비활성화"""
+    args.notion = False
+    args.dry_run = False
+    _get_console().print("[green]✓ Notion 저장이 비활성화되었습니다.[/green]")
+
+
+def _enable_notion_save(args: argparse.Namespace) -> None:
+    """Notion 저장 활성화"""
+    args.notion = True
+    args.dry_run = False
+    _get_console().print("[green]✓ Notion 저장이 활성화되었습니다.[/green]")
+
+
+def _toggle_update_existing(args: argparse.Namespace) -> None:
+    """중복 데이터 업데이트 ON/OFF"""
+    args.update_existing = not args.update_existing
+    status = "활성화" if args.update_existing else "비활성화"
+    _get_console().print(f"[green]✓ 중복 데이터 업데이트가 {status}되었습니다.[/green]")
+
+
 def show_notion_menu() -> None:
     """Notion 설정 메뉴"""
-    while True:
-        console.print()
-        console.print("[bold blue]📝 Notion 설정[/bold blue]")
-        console.print("[dim]" + "─" * 50 + "[/dim]")
-        console.print()
+    from rich.table import Table
+    console = _get_console()
 
+    # 설정값은 이 메뉴에서 저장/삭제할 때만 바뀌므로 루프 밖에서 읽고 변경 시 갱신
+    notion_api_key = config.get_notion_api_key()
+    databases = config.get_all_notion_databases()
+    while True:
         # Notion API 키 확인
-        notion_api_key = config.get_notion_api_key()
-        if notion_api_key:
-            masked_key = notion_api_key[:8] + "..." + notion_api_key[-4:] if len(notion_api_key) > 12 else "***"
-            api_key_status = f"[green]{masked_key}[/green]"
-        else:
-            api_key_status = "[dim]등록된 API 키 없음[/dim]"
-
-        # 등록된 데이터베이스 목록
-        databases = config.get_all_notion_databases()
+        api_key_status = _key_status(notion_api_key)
 
         # 현재 설정 정보
         info_table = Table(show_header=False, box=None, padding=(0, 1))
@@ -459,76 +710,109 @@ def show_notion_menu() -> None:
         info_table.add_row("Notion API 키", api_key_status)
 
         if databases:
-            db_list = "\n".join([f"[white]{auth}: {db_id[:8]}...{db_id[-4:]}[/white]"
+            db_list = "\n".join([f"[white]{auth}: {_mask(db_id)}[/white]"
                                  for auth, db_id in databases.items()])
             info_table.add_row("데이터베이스", db_list)
         else:
             info_table.add_row("데이터베이스", "[dim]등록된 데이터베이스 없음[/dim]")
 
-        console.print(info_table)
-        console.print()
-
         # 메뉴 옵션
-        menu_table = Table(show_header=False, box=None, padding=(0, 2))
-        menu_table.add_column("번호", style="bold cyan", width=4)
-        menu_table.add_column("메뉴", style="white")
-        menu_table.add_row("1", "Notion API 키 입력/변경")
-        menu_table.add_row("2", "데이터베이스 ID 추가/수정")
-        menu_table.add_row("3", "데이터베이스 ID 삭제" if databases else "[dim]데이터베이스 ID 삭제[/dim]")
-        menu_table.add_row("4", "뒤로 가기")
-
-        console.print(menu_table)
+        menu_table = _get_menu_table(_NOTION_MENU_ROWS if databases else _NOTION_MENU_ROWS_EMPTY)
+        _print_group(*_header(_TITLE_NOTION), info_table, "", menu_table)
 
         try:
-            choice = Prompt.ask("\n[cyan]선택[/cyan]", choices=["1", "2", "3", "4"])
-            if choice == "1":
-                console.print()
-                notion_api_key = Prompt.ask("[cyan]Notion API 키[/cyan]").strip()
-                if notion_api_key:
-                    try:
-                        config.save_notion_api_key(notion_api_key)
-                        console.print("[green]✓ Notion API 키가 저장되었습니다.[/green]")
-                    except Exception as e:
-                        console.print(f"[red]Notion API 키 저장 실패: {e}[/red]")
-                else:
-                    console.print("[red]Notion API 키를 입력해주세요.[/red]")
-            elif choice == "2":
-                console.print()
-                auth_method = Prompt.ask("[cyan]키 별칭 (auth_method)[/cyan]").strip()
-                if not auth_method:
-                    console.print("[red]키 별칭을 입력해주세요.[/red]")
-                    continue
-
-                database_id = Prompt.ask("[cyan]Notion 데이터베이스 ID[/cyan]").strip()
-                if database_id:
-                    config.save_notion_database_id(auth_method, database_id)
-                    console.print(f"[green]✓ '{auth_method}'의 데이터베이스 ID가 저장되었습니다.[/green]")
-                else:
-                    console.print("[red]데이터베이스 ID를 입력해주세요.[/red]")
-            elif choice == "3":
-                databases = config.get_all_notion_databases()
-                if not databases:
-                    console.print("[yellow]삭제할 데이터베이스가 없습니다.[/yellow]")
-                    continue
-
-                console.print()
-                console.print("[cyan]삭제할 데이터베이스의 키 별칭:[/cyan]")
-                for auth_method in databases.keys():
-                    console.print(f"  - [white]{auth_method}[/white]")
-
-                console.print()
-                auth_method = Prompt.ask("[cyan]>>[/cyan]",
-                                        choices=list(databases.keys()))
-
-                # config에서 제거
-                config_data = config.get_config()
-                if "notion_databases" in config_data:
-                    del config_data["notion_databases"][auth_method]
-                    config.save_config(config_data)
-                console.print(f"[green]✓ '{auth_method}'의 데이터베이스 ID가 삭제되었습니다.[/green]")
-            elif choice == "4":
+            action = _NOTION_MENU_ACTIONS.get(_ask(_PROMPT_SELECT, _CHOICES_1_4))
+            if action is None:
                 break
+            action()
+            # 설정이 바뀌었을 수 있으므로 다시 읽음
+            notion_api_key = config.get_notion_api_key()
+            databases = config.get_all_notion_databases()
         except KeyboardInterrupt:
             break
         except Exception as e:
             console.print(f"[red]오류: {e}[/red]")
+
+
+def _input_notion_api_key() -> None:
+    """Notion API 키 입력 및 저장"""
+    from rich.prompt import Prompt
+    console = _get_console()
+
+    console.print()
+    notion_api_key = Prompt.ask("[cyan]Notion API 키[/cyan]").strip()
+    if not notion_api_key:
+        console.print("[red]Notion API 키를 입력해주세요.[/red]")
+        return
+
+    try:
+        config.save_notion_api_key(notion_api_key)
+        config.flush_config()
+        console.print("[green]✓ Notion API 키가 저장되었습니다.[/green]")
+    except Exception as e:
+        console.print(f"[red]Notion API 키 저장 실패: {e}[/red]")
+
+
+def _input_notion_database() -> None:
+    """auth_method별 Notion 데이터베이스 ID 추가/수정"""
+    from rich.prompt import Prompt
+    console = _get_console()
+
+    console.print()
+    auth_method = Prompt.ask("[cyan]키 별칭 (auth_method)[/cyan]").strip()
+    if not auth_method:
+        console.print("[red]키 별칭을 입력해주세요.[/red]")
+        return
+
+    database_id = Prompt.ask("[cyan]Notion 데이터베이스 ID[/cyan]").strip()
+    if database_id:
+        config.save_notion_database_id(auth_method, database_id)
+        config.flush_config()
+        console.print(f"[green]✓ '{auth_method}'의 데이터베이스 ID가 저장되었습니다.[/green]")
+    else:
+        console.print("[red]데이터베이스 ID를 입력해주세요.[/red]")
+
+
+def _delete_notion_database() -> None:
+    """Notion 데이터베이스 ID 삭제"""
+    from rich.prompt import Prompt
+    console = _get_console()
+
+    databases = config.get_all_notion_databases()
+    if not databases:
+        console.print("[yellow]삭제할 데이터베이스가 없습니다.[/yellow]")
+        return
+
+    _print_group(
+        "",
+        "[cyan]삭제할 데이터베이스의 키 별칭:[/cyan]",
+        *[f"  - [white]{auth_method}[/white]" for auth_method in databases],
+        ""
+    )
+    auth_method = Prompt.ask("[cyan]>>[/cyan]",
+                            choices=list(databases.keys()))
+
+    # config에서 제거
+    with config.config_transaction() as config_data:
+        config_data.get("notion_databases", {}).pop(auth_method, None)
+    console.print(f"[green]✓ '{auth_method}'의 데이터베이스 ID가 삭제되었습니다.[/green]")
+
+
+# 메뉴 선택 번호별 동작 (목록에 없는 번호는 '뒤로 가기')
+_MODEL_MENU_ACTIONS: Dict[str, Callable[[List[str]], List[str]]] = {
+    "1": add_model,
+    "2": _delete_model_if_any,
+}
+_API_KEY_MENU_ACTIONS: Dict[str, Callable[[Optional[str]], Optional[str]]] = {
+    "1": _input_api_key,
+}
+_NOTION_SAVE_MENU_ACTIONS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "1": _disable_notion_save,
+    "2": _enable_notion_save,
+    "3": _toggle_update_existing,
+}
+_NOTION_MENU_ACTIONS: Dict[str, Callable[[], None]] = {
+    "1": _input_notion_api_key,
+    "2": _input_notion_database,
+    "3": _delete_notion_database,
+}
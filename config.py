@@ -4,13 +4,18 @@
 """
 import os
 import json
+import copy
+import sys
+import atexit
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 
 try:
-    from dotenv import load_dotenv  # type: ignore
+    import orjson  # type: ignore
 except ImportError:
-    load_dotenv = None  # type: ignore
+    orjson = None  # type: ignore
 
 
 # 프로젝트 루트 디렉토리
@@ -19,35 +24,244 @@ CONFIG_FILE = PROJECT_ROOT / "config.json"
 ENV_FILE = PROJECT_ROOT / ".env"
 
 
+# .env 로딩 여부 (환경 변수가 처음 필요할 때 한 번만 로딩)
+_env_state: Dict[str, bool] = {"loaded": False}
+
+
 def load_env() -> None:
     """환경 변수 로딩 (.env 파일 지원)"""
-    if load_dotenv:
-        if ENV_FILE.exists():
-            load_dotenv(ENV_FILE)
-        else:
-            # .env 파일이 없어도 환경 변수는 로드 가능
-            load_dotenv(override=False)
+    _env_state["loaded"] = True
+    try:
+        from dotenv import load_dotenv  # type: ignore
+    except ImportError:
+        return
+    
+    if ENV_FILE.exists():
+        load_dotenv(ENV_FILE)
+    else:
+        # .env 파일이 없어도 환경 변수는 로드 가능
+        load_dotenv(override=False)
 
 
-def get_config() -> Dict[str, Any]:
-    """config.json 파일 로드"""
-    if CONFIG_FILE.exists():
+def _getenv(name: str) -> Optional[str]:
+    """환경 변수 조회 (최초 조회 시 .env 로딩)"""
+    if not _env_state["loaded"]:
+        load_env()
+    return os.getenv(name)
+
+
+# save_config 후 실제 파일 쓰기까지 기다리는 시간 (초) - 연속된 저장을 한 번의 쓰기로 합침
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# 파싱된 config.json 캐시 (파일 수정 시간(st_mtime_ns)이 바뀌었을 때만 다시 읽음)
+_config_cache: Dict[str, Any] = {"mtime": None, "data": None}
+
+# 아직 파일에 쓰지 않은 저장 내용과 쓰기 예약 타이머
+_pending: Dict[str, Any] = {"data": None, "timer": None, "error": None}
+_pending_lock = threading.RLock()
+
+# config_transaction 블록 안에서 수정 중인 config (블록 밖이면 None)
+_transaction: Dict[str, Any] = {"data": None}
+
+
+def invalidate_config_cache() -> None:
+    """config 캐시 초기화 (다음 조회 시 config.json을 다시 읽음)"""
+    _config_cache["mtime"] = _config_cache["data"] = None
+
+
+def _set_config_cache(data: Dict[str, Any], mtime: int) -> None:
+    """방금 읽거나 기록한 config 데이터를 캐시에 저장"""
+    _config_cache["mtime"] = mtime
+    _config_cache["data"] = data
+
+
+def _load_config_data() -> Dict[str, Any]:
+    """
+    캐시된 config 데이터 반환 (파일 수정 시간이 바뀌었을 때만 다시 파싱)
+    
+    반환값은 캐시 원본이므로 수정하면 안 됨 (수정이 필요하면 get_config 사용)
+    """
+    data = _load_stored_config()
+    if data is None:
+        return _get_default_config()
+    return data
+
+
+def _load_stored_config() -> Optional[Dict[str, Any]]:
+    """
+    실제로 저장된(또는 저장 대기 중인) config 데이터 반환
+    
+    config.json이 없거나 읽을 수 없으면 기본값 대신 None 반환
+    """
+    # 진행 중인 트랜잭션, 쓰기 대기 중인 저장 내용 순으로 최신
+    if _transaction["data"] is not None:
+        return _transaction["data"]
+    pending = _pending["data"]
+    if pending is not None:
+        return pending
+    
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        invalidate_config_cache()
+        return None
+    
+    if _config_cache["data"] is None or _config_cache["mtime"] != mtime:
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            # 파일이 손상되었거나 읽을 수 없으면 기본값 반환
-            return _get_default_config()
-    return _get_default_config()
+            with open(CONFIG_FILE, "rb") as f:
+                data = _json_loads(f.read())
+        except (ValueError, IOError):
+            # 파일이 손상되었거나 읽을 수 없음
+            return None
+        _set_config_cache(data, mtime)
+    
+    return _config_cache["data"]
+
+
+def _json_loads(raw: bytes) -> Any:
+    """JSON 파싱 (orjson이 설치되어 있으면 bytes를 직접 파싱)"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """들여쓰기 2칸의 UTF-8 JSON bytes로 직렬화 (orjson이 설치되어 있으면 사용)"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def get_config() -> Dict[str, Any]:
+    """
+    config.json 파일 로드
+    
+    파일이 바뀌지 않았으면 캐시된 내용을 사용하며,
+    호출자가 수정해도 캐시에 영향이 없도록 복사본을 반환
+    """
+    return copy.deepcopy(_load_config_data())
 
 
 def save_config(config: Dict[str, Any]) -> None:
-    """config.json 파일 저장"""
+    """
+    config.json 파일 저장 예약
+    
+    저장 내용은 즉시 get_* 조회에 반영되고, 파일 쓰기는 SAVE_DEBOUNCE_SECONDS 동안
+    추가 저장이 없을 때 한 번만 수행 (종료 시 또는 flush_config 호출 시 즉시 기록)
+    """
+    with _pending_lock:
+        _pending["data"] = copy.deepcopy(config)
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+        timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, _flush_in_background)
+        timer.daemon = True
+        _pending["timer"] = timer
+        timer.start()
+
+
+@contextmanager
+def config_transaction() -> Iterator[Dict[str, Any]]:
+    """
+    여러 설정 변경을 묶어 한 번만 저장
+    
+    블록 안의 save_* 호출은 같은 config를 수정하며, 블록이 정상 종료되고
+    내용이 바뀌었으면 save_config가 한 번만 호출됨 (예외 발생 시 변경 내용은 버려짐)
+    
+    사용 예:
+        with config_transaction() as data:
+            data["timezone"] = "Asia/Seoul"
+            save_models(["fal-ai/flux/dev"])
+    """
+    if _transaction["data"] is not None:
+        # 중첩된 트랜잭션은 바깥 트랜잭션에 합쳐짐
+        yield _transaction["data"]
+        return
+    
+    # 잠금은 시작/저장 시점에만 잡음 (블록 안의 입력 대기 중에도 백그라운드 flush가 막히지 않도록)
+    with _pending_lock:
+        snapshot = _load_stored_config()
+        data = get_config()
+        _transaction["data"] = data
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        yield data
+    finally:
+        _transaction["data"] = None
+    
+    with _pending_lock:
+        # 저장된 내용과 같으면 쓰기를 예약하지 않음 (파일이 없으면 항상 저장)
+        if snapshot is None or data != snapshot:
+            save_config(data)
+
+
+def flush_config() -> None:
+    """쓰기 대기 중인 config를 즉시 파일에 기록"""
+    with _pending_lock:
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+            _pending["timer"] = None
+        data = _pending["data"]
+        error, _pending["error"] = _pending["error"], None
+        if data is None:
+            # 백그라운드 기록 실패는 여기서 호출한 쪽에 알림
+            if error is not None:
+                raise error
+            return
+        
+        try:
+            _write_config_file(data)
+        except IOError as e:
+            # 기록하지 못한 내용은 남겨 두고 다음 flush에서 다시 시도
+            raise IOError(f"설정 파일 저장 실패: {e}")
+        
+        _pending["data"] = None
+        # 방금 기록한 내용을 캐시에 넣어 다음 조회 때 다시 읽지 않도록 함
+        try:
+            _set_config_cache(data, os.stat(CONFIG_FILE).st_mtime_ns)
+        except OSError:
+            invalidate_config_cache()
+
+
+def _write_config_file(data: Dict[str, Any]) -> None:
+    """
+    config.json 원자적 기록
+    
+    임시 파일에 쓰고 fsync 후 os.replace로 교체하므로
+    쓰는 도중 종료되어도 기존 파일이 깨지지 않음
+    """
+    tmp_file = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+def _flush_in_background() -> None:
+    """타이머 스레드용 flush (실패 내용은 다음 flush_config 호출 시 보고)"""
+    try:
+        flush_config()
     except IOError as e:
-        raise IOError(f"설정 파일 저장 실패: {e}")
+        with _pending_lock:
+            _pending["error"] = e
+
+
+def _flush_at_exit() -> None:
+    """종료 시 flush (트레이스백 대신 오류 메시지만 표시)"""
+    try:
+        flush_config()
+    except IOError as e:
+        print(e, file=sys.stderr)
+
+
+# 프로그램 종료 전 쓰기 대기 중인 설정 기록
+atexit.register(_flush_at_exit)
 
 
 def _get_default_config() -> Dict[str, Any]:
@@ -61,6 +275,15 @@ def _get_default_config() -> Dict[str, Any]:
     }
 
 
+def _save_value(key: str, value: Any) -> None:
+    """config의 최상위 값 하나를 저장 (이미 저장된 값과 같으면 저장하지 않음)"""
+    stored = _load_stored_config()
+    if stored is not None and stored.get(key) == value:
+        return
+    with config_transaction() as config:
+        config[key] = value
+
+
 def get_api_key(cli_api_key: Optional[str] = None) -> Optional[str]:
     """
     fal.ai Admin API 키 가져오기
@@ -69,67 +292,55 @@ def get_api_key(cli_api_key: Optional[str] = None) -> Optional[str]:
     if cli_api_key:
         return cli_api_key
     
-    config = get_config()
-    api_key = config.get("api_key")
+    api_key = _load_config_data().get("api_key")
     if api_key:
         return api_key
     
-    api_key = os.getenv("FAL_ADMIN_API_KEY")
+    api_key = _getenv("FAL_ADMIN_API_KEY")
     return api_key
 
 
 def save_api_key(api_key: str) -> None:
     """API 키를 config.json에 저장"""
-    config = get_config()
-    config["api_key"] = api_key
-    save_config(config)
+    _save_value("api_key", api_key)
 
 def save_models(models: List[str]) -> None:
     """모델 목록을 config.json에 저장"""
-    config = get_config()
-    config["models"] = models
-    save_config(config)
+    _save_value("models", models)
 
 
 def get_models() -> List[str]:
-    """config.json에서 모델 목록 가져오기"""
-    config = get_config()
-    return config.get("models", [])
+    """config.json에서 모델 목록 가져오기 (캐시 원본 대신 얕은 복사본 반환)"""
+    return list(_load_config_data().get("models", []))
 
 
 def get_timezone() -> str:
     """기본 타임존 가져오기"""
-    config = get_config()
-    return config.get("timezone", "GMT")
+    return _load_config_data().get("timezone", "GMT")
 
 
 def set_timezone(timezone: str) -> None:
     """기본 타임존 설정"""
-    config = get_config()
-    config["timezone"] = timezone
-    save_config(config)
+    _save_value("timezone", timezone)
 
 
 def save_notion_database_id(auth_method: str, database_id: str) -> None:
     """auth_method별 Notion 데이터베이스 ID 저장"""
-    config = get_config()
-    if "notion_databases" not in config:
-        config["notion_databases"] = {}
-    config["notion_databases"][auth_method] = database_id
-    save_config(config)
+    stored = _load_stored_config()
+    if stored is not None and stored.get("notion_databases", {}).get(auth_method) == database_id:
+        return
+    with config_transaction() as config:
+        config.setdefault("notion_databases", {})[auth_method] = database_id
 
 
 def get_notion_database_id(auth_method: str) -> Optional[str]:
     """auth_method별 Notion 데이터베이스 ID 가져오기"""
-    config = get_config()
-    notion_databases = config.get("notion_databases", {})
-    return notion_databases.get(auth_method)
+    return _load_config_data().get("notion_databases", {}).get(auth_method)
 
 
 def get_all_notion_databases() -> Dict[str, str]:
-    """모든 Notion 데이터베이스 ID 가져오기"""
-    config = get_config()
-    return config.get("notion_databases", {})
+    """모든 Notion 데이터베이스 ID 가져오기 (캐시 원본 대신 얕은 복사본 반환)"""
+    return dict(_load_config_data().get("notion_databases", {}))
 
 
 def get_notion_api_key(cli_notion_api_key: Optional[str] = None) -> Optional[str]:
@@ -140,21 +351,13 @@ def get_notion_api_key(cli_notion_api_key: Optional[str] = None) -> Optional[str
     if cli_notion_api_key:
         return cli_notion_api_key
     
-    config_data = get_config()
-    notion_api_key = config_data.get("notion_api_key")
+    notion_api_key = _load_config_data().get("notion_api_key")
     if notion_api_key:
         return notion_api_key
     
-    return os.getenv("NOTION_API_KEY")
+    return _getenv("NOTION_API_KEY")
 
 
 def save_notion_api_key(api_key: str) -> None:
     """Notion API 키를 config.json에 저장"""
-    config_data = get_config()
-    config_data["notion_api_key"] = api_key
-    save_config(config_data)
-
-
-# 모듈 로드 시 환경 변수 자동 로딩
-load_env()
-
+    _save_value("notion_api_key", api_key)
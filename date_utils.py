@@ -3,11 +3,45 @@
 ISO8601 형식 변환, preset 처리, 타임존 변환
 """
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 import config
 
 
+# 호출마다 새로 만들 필요 없는 상수
+_UTC = timezone.utc
+_ONE_DAY = timedelta(days=1)
+_SEVEN_DAYS = timedelta(days=7)
+_THIRTY_DAYS = timedelta(days=30)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=16)
+def get_zoneinfo(name: str) -> ZoneInfo:
+    """
+    타임존 이름에 해당하는 ZoneInfo 객체 반환 (같은 이름은 재사용)
+    
+    Args:
+        name: 타임존 이름 (예: Asia/Seoul)
+    
+    Returns:
+        ZoneInfo 객체
+    """
+    return ZoneInfo(name)
+
+
+def _resolve_tzinfo(tz: Optional[str] = None):
+    """
+    타임존 이름을 tzinfo로 변환 (없으면 config 기본 타임존, 그것도 없으면 UTC)
+    
+    ZoneInfo 객체는 get_zoneinfo 캐시에서 재사용
+    """
+    if not tz:
+        tz = config.get_timezone()
+    return get_zoneinfo(tz) if tz else _UTC
+
+
 def parse_date(date_str: str, tz: Optional[str] = None) -> datetime:
     """
     날짜 문자열을 datetime 객체로 변환
@@ -22,13 +56,34 @@ def parse_date(date_str: str, tz: Optional[str] = None) -> datetime:
     """
     if not tz:
         tz = config.get_timezone()
+    return _parse_date_cached(date_str, tz or "")
+
+
+@lru_cache(maxsize=64)
+def _parse_date_cached(date_str: str, tz: str) -> datetime:
+    """
+    parse_date 본체 (같은 날짜 문자열/타임존 조합은 파싱 결과 재사용)
+    
+    datetime은 불변 객체이므로 캐시된 값을 그대로 반환해도 안전
+    """
+    timezone_obj = get_zoneinfo(tz) if tz else _UTC
     
-    # 타임존 객체 생성
-    timezone_obj = ZoneInfo(tz) if tz else timezone.utc
+    # YYYY-MM-DD 형식은 파서를 거치지 않고 바로 생성
+    # (int()는 공백/부호를 허용하므로 숫자인지 먼저 확인)
+    if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]), tzinfo=timezone_obj)
+        except ValueError:
+            pass
     
     # ISO8601 형식 시도 (예: 2025-01-01T00:00:00Z 또는 2025-01-01T00:00:00+09:00)
     try:
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        if date_str.endswith('Z'):
+            date_str_parsed = date_str[:-1] + '+00:00'
+        else:
+            date_str_parsed = date_str
+        dt = datetime.fromisoformat(date_str_parsed)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone_obj)
         return dt
@@ -59,16 +114,38 @@ def to_iso8601(dt: datetime, include_time: bool = True) -> str:
     Returns:
         ISO8601 형식 문자열
     """
-    # UTC로 변환
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt = dt.astimezone(timezone.utc)
-    
+    dt = convert_to_utc(dt)
     if include_time:
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return _fmt_utc_datetime(dt)
     else:
-        return dt.strftime("%Y-%m-%d")
+        return _fmt_utc_date(dt)
+
+
+# 고정 형식이므로 strftime 대신 정수 포맷팅 (UTC datetime 전용)
+def _fmt_utc_datetime(dt: datetime) -> str:
+    """UTC datetime -> YYYY-MM-DDTHH:MM:SSZ"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+
+
+def _fmt_utc_date(dt: datetime) -> str:
+    """UTC datetime -> YYYY-MM-DD"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _floor_day(dt: datetime) -> datetime:
+    """같은 날의 00:00:00.000000으로 내림"""
+    return dt - timedelta(hours=dt.hour, minutes=dt.minute, seconds=dt.second, microseconds=dt.microsecond)
+
+
+# preset 이름별 (현재 시각 -> (시작, 종료)) 계산 함수
+_PRESET_RANGES: Dict[str, Callable[[datetime], Tuple[datetime, datetime]]] = {
+    "today": lambda now: (_floor_day(now), now),
+    # 어제 00:00:00 ~ 어제 23:59:59.999999
+    "yesterday": lambda now: (_floor_day(now - _ONE_DAY), _floor_day(now) - _ONE_MICROSECOND),
+    "last-7-days": lambda now: (_floor_day(now - _SEVEN_DAYS), now),
+    "last-30-days": lambda now: (_floor_day(now - _THIRTY_DAYS), now),
+    "this-month": lambda now: (_floor_day(now) - timedelta(days=now.day - 1), now),
+}
 
 
 def get_preset_range(preset: str, tz: Optional[str] = None) -> Tuple[datetime, datetime]:
@@ -82,32 +159,11 @@ def get_preset_range(preset: str, tz: Optional[str] = None) -> Tuple[datetime, d
     Returns:
         (시작 날짜, 종료 날짜) 튜플
     """
-    if not tz:
-        tz = config.get_timezone()
-    
-    timezone_obj = ZoneInfo(tz) if tz else timezone.utc
-    now = datetime.now(timezone_obj)
-    
-    if preset == "today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    elif preset == "yesterday":
-        yesterday = now - timedelta(days=1)
-        start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
-    elif preset == "last-7-days":
-        start = (now - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    elif preset == "last-30-days":
-        start = (now - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    elif preset == "this-month":
-        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    else:
+    range_func = _PRESET_RANGES.get(preset)
+    if range_func is None:
         raise ValueError(f"알 수 없는 preset: {preset}")
     
-    return start, end
+    return range_func(datetime.now(_resolve_tzinfo(tz)))
 
 
 def get_default_date_range(tz: Optional[str] = None) -> Tuple[datetime, datetime]:
@@ -120,12 +176,8 @@ def get_default_date_range(tz: Optional[str] = None) -> Tuple[datetime, datetime
     Returns:
         (시작 날짜, 종료 날짜) 튜플
     """
-    if not tz:
-        tz = config.get_timezone()
-    
-    timezone_obj = ZoneInfo(tz) if tz else timezone.utc
-    now = datetime.now(timezone_obj)
-    start = (now - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+    now = datetime.now(_resolve_tzinfo(tz))
+    start = _floor_day(now - _SEVEN_DAYS)
     
     return start, now
 
@@ -160,8 +212,7 @@ def parse_date_range(
             end = parse_date(end_date, tz)
         else:
             # end_date가 없으면 현재 시간
-            timezone_obj = ZoneInfo(tz) if tz else timezone.utc
-            end = datetime.now(timezone_obj)
+            end = datetime.now(_resolve_tzinfo(tz))
     else:
         # 둘 다 없으면 기본값 (일주일 전부터 현재까지)
         start, end = get_default_date_range(tz)
@@ -183,9 +234,12 @@ def convert_to_utc(dt: datetime) -> datetime:
     Returns:
         UTC로 변환된 datetime 객체
     """
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+    tzinfo = dt.tzinfo
+    if tzinfo is _UTC:
+        return dt
+    if tzinfo is None:
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
 
 
 def format_date_range_for_api(
@@ -204,8 +258,6 @@ def format_date_range_for_api(
     Returns:
         (시작 날짜 문자열, 종료 날짜 문자열) 튜플
     """
-    start_utc = convert_to_utc(start)
-    end_utc = convert_to_utc(end)
-    
-    return to_iso8601(start_utc, include_time), to_iso8601(end_utc, include_time)
+    fmt = _fmt_utc_datetime if include_time else _fmt_utc_date
+    return fmt(convert_to_utc(start)), fmt(convert_to_utc(end))
 
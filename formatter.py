@@ -2,15 +2,72 @@
 데이터 출력 및 포맷팅
 CLI 테이블 형식 출력
 """
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 from datetime import datetime
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-import usage_tracker
+from functools import lru_cache
+from usage_tracker import _cost_key
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+
+
+# rich는 import 비용이 크므로 실제 출력할 때 처음 로딩
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Rich console 인스턴스 반환 (최초 호출 시 rich import 및 생성)"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# 테이블별 컬럼 구성: (헤더, 스타일, 정렬, 줄바꿈 금지)
+_ColumnSpec = Tuple[str, str, str, bool]
+
+_SUMMARY_COLUMNS: Tuple[_ColumnSpec, ...] = (
+    ("항목", "cyan", "left", True),
+    ("값", "green", "right", False),
+)
+_MODEL_COLUMNS: Tuple[_ColumnSpec, ...] = (
+    ("모델", "cyan", "left", False),
+    ("요청 수", "yellow", "right", False),
+    ("사용량", "yellow", "right", False),
+    ("단가", "blue", "right", False),
+    ("비용", "green", "right", False),
+)
+_AUTH_METHOD_COLUMNS: Tuple[_ColumnSpec, ...] = (
+    ("키 별칭", "cyan", "left", True),
+    ("요청 수", "yellow", "right", False),
+    ("사용량", "yellow", "right", False),
+    ("비용", "green", "right", False),
+)
+
+
+@lru_cache(maxsize=8)
+def _table_title(markup: str) -> "Text":
+    """
+    테이블 제목 Text 반환 (마크업은 제목별로 최초 1회만 파싱)
+    
+    문자열 제목과 같은 모양이 되도록 기본 제목 스타일(table.title)을 적용
+    """
+    from rich.text import Text
+    return Text.from_markup(markup, style="table.title")
+
 
+def _make_table(title: str, columns: Tuple[_ColumnSpec, ...]) -> "Table":
+    """컬럼 구성이 적용된 빈 테이블 생성 (행은 호출자가 추가)"""
+    from rich.table import Table
 
-console = Console()
+    table = Table(title=_table_title(title), show_header=True, header_style="bold magenta")
+    add_column = table.add_column
+    for header, style, justify, no_wrap in columns:
+        add_column(header, style=style, justify=justify, no_wrap=no_wrap)
+    return table
 
 
 def format_currency(amount: float) -> str:
@@ -23,47 +80,41 @@ def format_number(num: float) -> str:
     return f"{num:,.0f}"
 
 
+def _iso_to_display(iso_str: str) -> str:
+    """
+    ISO8601 문자열을 "YYYY-MM-DD HH:MM:SS" 표시 형식으로 변환
+    
+    이미 사용자 타임존으로 변환된 값이므로 타임존 변환 없이 그대로 표시하며,
+    "YYYY-MM-DDTHH:MM:SS..." 형태는 파싱 없이 잘라서 사용
+    """
+    if not iso_str:
+        return iso_str
+    if len(iso_str) >= 19 and iso_str[10] == "T":
+        return f"{iso_str[:10]} {iso_str[11:19]}"
+
+    # 그 외 형식은 파싱 후 변환 (Z를 +00:00으로 변환 - fromisoformat 호환성)
+    try:
+        if iso_str.endswith('Z'):
+            iso_str_parsed = iso_str.replace('Z', '+00:00')
+        else:
+            iso_str_parsed = iso_str
+        return datetime.fromisoformat(iso_str_parsed).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, AttributeError):
+        return iso_str
+
+
 def print_period_info(meta: Dict[str, Any]):
     """조회 기간 정보 출력"""
+    from rich.panel import Panel
+
     start_str = meta.get("start", "")
     end_str = meta.get("end", "")
     timezone = meta.get("timezone", "")
     timeframe = meta.get("timeframe")
 
     # ISO8601 형식을 일반 날짜 형식으로 변환
-    try:
-        if start_str:
-            # Z를 +00:00으로 변환 (fromisoformat 호환성)
-            # 이미 타임존 정보가 포함된 경우 그대로 사용
-            if start_str.endswith('Z'):
-                start_str_parsed = start_str.replace('Z', '+00:00')
-            else:
-                start_str_parsed = start_str
-            start_dt = datetime.fromisoformat(start_str_parsed)
-            # 타임존 정보가 포함된 datetime 객체의 값 그대로 출력
-            # (이미 사용자 타임존으로 변환된 값이므로 그대로 출력)
-            start_display = start_dt.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            start_display = start_str
-    except (ValueError, AttributeError):
-        start_display = start_str
-
-    try:
-        if end_str:
-            # Z를 +00:00으로 변환 (fromisoformat 호환성)
-            # 이미 타임존 정보가 포함된 경우 그대로 사용
-            if end_str.endswith('Z'):
-                end_str_parsed = end_str.replace('Z', '+00:00')
-            else:
-                end_str_parsed = end_str
-            end_dt = datetime.fromisoformat(end_str_parsed)
-            # 타임존 정보가 포함된 datetime 객체의 값 그대로 출력
-            # (이미 사용자 타임존으로 변환된 값이므로 그대로 출력)
-            end_display = end_dt.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            end_display = end_str
-    except (ValueError, AttributeError):
-        end_display = end_str
+    start_display = _iso_to_display(start_str)
+    end_display = _iso_to_display(end_str)
 
     # Panel 안에 한 줄로 표시
     info_text = f"조회 기간: {start_display} ~ {end_display}"
@@ -72,16 +123,16 @@ def print_period_info(meta: Dict[str, Any]):
     if timeframe:
         info_text += f" | 집계 단위: {timeframe}"
 
-    console.print(Panel(info_text, title="[bold blue]조회 정보[/bold blue]", border_style="blue"))
+    _get_console().print(Panel(info_text, title="[bold blue]조회 정보[/bold blue]", border_style="blue"))
 
 
 def print_summary_table(calculated_data: Dict[str, Any]):
     """전체 사용량 요약 테이블 출력"""
+    console = _get_console()
+
     total = calculated_data["total"]
     
-    table = Table(title="[bold green]전체 사용량 요약[/bold green]", show_header=True, header_style="bold magenta")
-    table.add_column("항목", style="cyan", no_wrap=True)
-    table.add_column("값", style="green", justify="right")
+    table = _make_table("[bold green]전체 사용량 요약[/bold green]", _SUMMARY_COLUMNS)
     
     table.add_row("총 요청 수", format_number(total["requests"]))
     table.add_row("총 사용량", format_number(total["quantity"]))
@@ -93,34 +144,41 @@ def print_summary_table(calculated_data: Dict[str, Any]):
 
 def print_model_table(calculated_data: Dict[str, Any]):
     """모델별 상세 사용량 테이블 출력"""
+    from rich.text import Text
+    console = _get_console()
+
     by_model = calculated_data["by_model"]
     
     if not by_model:
         console.print("[yellow]모델별 데이터가 없습니다.[/yellow]")
         return
     
-    table = Table(title="[bold green]모델별 상세 사용량[/bold green]", show_header=True, header_style="bold magenta")
-    table.add_column("모델", style="cyan", no_wrap=False)
-    table.add_column("요청 수", style="yellow", justify="right")
-    table.add_column("사용량", style="yellow", justify="right")
-    table.add_column("단가", style="blue", justify="right")
-    table.add_column("비용", style="green", justify="right")
-    
-    # 비용 순으로 정렬
-    sorted_models = sorted(
-        by_model.items(),
-        key=lambda x: x[1]["cost"],
-        reverse=True
-    )
-    
-    for endpoint_id, stats in sorted_models:
-        table.add_row(
+    table = _make_table("[bold green]모델별 상세 사용량[/bold green]", _MODEL_COLUMNS)
+    
+    # 비용 순 목록은 calculate_costs가 미리 정렬해 둔 것을 사용 (없으면 여기서 정렬)
+    sorted_models = calculated_data.get("by_model_sorted")
+    if sorted_models is None:
+        sorted_models = sorted(by_model.items(), key=_cost_key, reverse=True)
+    
+    # 셀 문자열을 한 번에 생성 (포맷 함수는 지역 변수로 바인딩)
+    fmt_n = format_number
+    fmt_c = format_currency
+    rows = [
+        (
             endpoint_id,
-            format_number(stats["requests"]),
-            format_number(stats["quantity"]),
-            format_currency(stats["unit_price"]),
-            format_currency(stats["cost"])
+            fmt_n(stats["requests"]),
+            fmt_n(stats["quantity"]),
+            fmt_c(stats["unit_price"]),
+            fmt_c(stats["cost"])
         )
+        for endpoint_id, stats in sorted_models
+    ]
+    
+    # 셀 값은 마크업이 아니므로 Text로 넘겨 rich의 마크업 파싱을 건너뜀
+    # (모델 ID 등에 "[...]"가 있어도 그대로 표시됨)
+    add_row = table.add_row
+    for row in rows:
+        add_row(*map(Text, row))
     
     console.print(table)
     console.print()
@@ -128,25 +186,34 @@ def print_model_table(calculated_data: Dict[str, Any]):
 
 def print_auth_method_table(calculated_data: Dict[str, Any]):
     """사용자 키별 사용량 테이블 출력"""
+    from rich.text import Text
+    console = _get_console()
+
     auth_methods = calculated_data.get("by_auth_method", {})
     
     if not auth_methods:
         # auth_method 정보가 없으면 스킵
         return
     
-    table = Table(title="[bold green]사용자 키별 사용량[/bold green]", show_header=True, header_style="bold magenta")
-    table.add_column("키 별칭", style="cyan", no_wrap=True)
-    table.add_column("요청 수", style="yellow", justify="right")
-    table.add_column("사용량", style="yellow", justify="right")
-    table.add_column("비용", style="green", justify="right")
+    table = _make_table("[bold green]사용자 키별 사용량[/bold green]", _AUTH_METHOD_COLUMNS)
     
-    for key_alias, stats in sorted(auth_methods.items(), key=lambda x: x[1]["cost"], reverse=True):
-        table.add_row(
+    fmt_n = format_number
+    fmt_c = format_currency
+    rows = [
+        (
             key_alias,
-            format_number(stats["requests"]),
-            format_number(stats["quantity"]),
-            format_currency(stats["cost"])
+            fmt_n(stats["requests"]),
+            fmt_n(stats["quantity"]),
+            fmt_c(stats["cost"])
         )
+        for key_alias, stats in sorted(auth_methods.items(), key=_cost_key, reverse=True)
+    ]
+    
+    # 셀 값은 마크업이 아니므로 Text로 넘겨 rich의 마크업 파싱을 건너뜀
+    # (키 별칭에 "[...]"가 있어도 그대로 표시됨)
+    add_row = table.add_row
+    for row in rows:
+        add_row(*map(Text, row))
     
     console.print(table)
     console.print()
@@ -161,6 +228,9 @@ def format_for_display(
     Args:
         usage_data: Usage API 응답 데이터
     """
+    import usage_tracker
+    console = _get_console()
+
     # 비용 계산 (Usage API의 unit_price 사용)
     calculated_data = usage_tracker.calculate_costs(usage_data)
     
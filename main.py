@@ -3,21 +3,29 @@ fal.ai 사용량 추적 CLI
 메인 실행 로직 및 핵심 기능
 """
 import sys
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from datetime import datetime
-from rich.console import Console
-from rich.prompt import Prompt
-import api_client
 import config
 import date_utils
-import formatter
-import usage_tracker
-import notion_integration
 import cli_args
-import cli_menus
 
-# Rich console 인스턴스
-console = Console()
+# rich, API/Notion 클라이언트, 출력 모듈은 실제로 사용하는 시점에 import
+# (--help 등 인자 파싱만 하고 끝나는 경우 시작 시간 단축)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Rich console 인스턴스 (첫 사용 시 생성)
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Rich console 인스턴스 반환 (최초 호출 시 rich import 및 생성)"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 def get_models_from_args(args) -> List[str]:
@@ -59,6 +67,7 @@ def parse_date_range(args) -> tuple[datetime, datetime]:
 
 def validate_and_execute_query(args) -> None:
     """필수 값 검증 후 조회 실행"""
+    console = _get_console()
     # API 키 확인
     api_key = config.get_api_key(args.api_key)
     if not api_key:
@@ -94,6 +103,9 @@ def save_to_notion(
     update_existing: bool = False
 ) -> None:
     """Notion에 데이터 저장"""
+    import notion_integration
+    import usage_tracker
+    console = _get_console()
     try:
         # CLI 인자로 전달된 database_id를 파싱
         cli_database_map = {}
@@ -123,9 +135,6 @@ def save_to_notion(
             console.print("[yellow]환경 변수 NOTION_API_KEY를 설정하거나 -notion-api-key 옵션을 사용하세요.[/yellow]")
             return
 
-        # Notion 클라이언트 생성
-        notion = notion_integration.NotionClient(notion_api_key)
-
         # 사용량 데이터를 Notion 형식으로 변환
         notion_data_by_auth = usage_tracker.format_for_notion(usage_data)
 
@@ -139,80 +148,82 @@ def save_to_notion(
                 console.print(f"  - {auth_method}: {len(records)}개 레코드")
             return
 
-        # auth_method별로 데이터 저장
-        total_created = 0
-        total_updated = 0
-        total_skipped = 0
+        # Notion 클라이언트 생성 (저장이 끝나면 Session 연결 해제)
+        with notion_integration.NotionClient(notion_api_key) as notion:
+            # auth_method별로 데이터 저장
+            total_created = 0
+            total_updated = 0
+            total_skipped = 0
 
-        if verbose:
-            console.print(f"\n[dim][DEBUG] 변환된 데이터: {len(notion_data_by_auth)}개 auth_method[/dim]")
-            for auth_method, records in notion_data_by_auth.items():
-                console.print(f"  - {auth_method}: {len(records)}개 레코드")
-
-        for auth_method, records in notion_data_by_auth.items():
             if verbose:
-                console.print(f"\n[dim][DEBUG] 처리 중인 auth_method: '{auth_method}' ({len(records)}개 레코드)[/dim]")
-
-            # 데이터베이스 ID 가져오기 (우선순위: CLI 맵 > CLI 공통 > config.json)
-            database_id = None
-            if cli_database_map:
-                # 1. 해당 auth_method의 database_id가 CLI 맵에 있는지 확인
-                if auth_method in cli_database_map:
-                    database_id = cli_database_map[auth_method]
-                # 2. "__all__" 키가 있으면 모든 auth_method에 적용
-                elif "__all__" in cli_database_map:
-                    database_id = cli_database_map["__all__"]
-
-            # 3. CLI에 없으면 config.json에서 가져오기
-            if not database_id:
-                database_id = config.get_notion_database_id(auth_method)
-
-            # 데이터베이스 ID가 없으면 등록된 모든 데이터베이스 확인
-            if not database_id:
-                all_databases = config.get_all_notion_databases()
-
-                # 등록된 데이터베이스가 하나만 있으면 자동으로 사용
-                if len(all_databases) == 1:
-                    database_id = list(all_databases.values())[0]
-                    if verbose:
-                        console.print(f"[yellow]'{auth_method}'의 데이터베이스 ID가 없어서 유일한 데이터베이스를 사용합니다.[/yellow]")
-                else:
-                    if verbose:
-                        console.print(f"[yellow][WARNING] '{auth_method}'의 Notion 데이터베이스 ID가 설정되지 않았습니다.[/yellow]")
-                        console.print(f"[dim]          등록된 데이터베이스 키: {list(all_databases.keys())}[/dim]")
-                        console.print(f"[dim]          {len(records)}개 레코드가 스킵되었습니다.[/dim]")
-                        console.print(f"\n[cyan]해결 방법:[/cyan]")
-                        console.print(f"[dim]          1. 인터랙티브 메뉴에서 '4. Notion 설정' > '2. 데이터베이스 ID 추가/수정' 선택[/dim]")
-                        console.print(f"[dim]          2. 키 별칭에 '{auth_method}' 입력[/dim]")
-                        console.print(f"[dim]          3. 해당 데이터베이스 ID 입력[/dim]")
+                console.print(f"\n[dim][DEBUG] 변환된 데이터: {len(notion_data_by_auth)}개 auth_method[/dim]")
+                for auth_method, records in notion_data_by_auth.items():
+                    console.print(f"  - {auth_method}: {len(records)}개 레코드")
+
+            for auth_method, records in notion_data_by_auth.items():
+                if verbose:
+                    console.print(f"\n[dim][DEBUG] 처리 중인 auth_method: '{auth_method}' ({len(records)}개 레코드)[/dim]")
+
+                # 데이터베이스 ID 가져오기 (우선순위: CLI 맵 > CLI 공통 > config.json)
+                database_id = None
+                if cli_database_map:
+                    # 1. 해당 auth_method의 database_id가 CLI 맵에 있는지 확인
+                    if auth_method in cli_database_map:
+                        database_id = cli_database_map[auth_method]
+                    # 2. "__all__" 키가 있으면 모든 auth_method에 적용
+                    elif "__all__" in cli_database_map:
+                        database_id = cli_database_map["__all__"]
+
+                # 3. CLI에 없으면 config.json에서 가져오기
+                if not database_id:
+                    database_id = config.get_notion_database_id(auth_method)
+
+                # 데이터베이스 ID가 없으면 등록된 모든 데이터베이스 확인
+                if not database_id:
+                    all_databases = config.get_all_notion_databases()
+
+                    # 등록된 데이터베이스가 하나만 있으면 자동으로 사용
+                    if len(all_databases) == 1:
+                        database_id = list(all_databases.values())[0]
+                        if verbose:
+                            console.print(f"[yellow]'{auth_method}'의 데이터베이스 ID가 없어서 유일한 데이터베이스를 사용합니다.[/yellow]")
+                    else:
+                        if verbose:
+                            console.print(f"[yellow][WARNING] '{auth_method}'의 Notion 데이터베이스 ID가 설정되지 않았습니다.[/yellow]")
+                            console.print(f"[dim]          등록된 데이터베이스 키: {list(all_databases.keys())}[/dim]")
+                            console.print(f"[dim]          {len(records)}개 레코드가 스킵되었습니다.[/dim]")
+                            console.print(f"\n[cyan]해결 방법:[/cyan]")
+                            console.print(f"[dim]          1. 인터랙티브 메뉴에서 '4. Notion 설정' > '2. 데이터베이스 ID 추가/수정' 선택[/dim]")
+                            console.print(f"[dim]          2. 키 별칭에 '{auth_method}' 입력[/dim]")
+                            console.print(f"[dim]          3. 해당 데이터베이스 ID 입력[/dim]")
+                        total_skipped += len(records)
+                        continue
+
+                # 데이터베이스 존재 여부 확인
+                if verbose:
+                    console.print(f"[dim][DEBUG] 데이터베이스 ID 확인 중: {database_id}[/dim]")
+                if not notion.check_database_exists(database_id, verbose=verbose):
+                    console.print(f"\n[red]'{auth_method}'의 데이터베이스(ID: {database_id})를 찾을 수 없습니다.[/red]")
                     total_skipped += len(records)
                     continue
 
-            # 데이터베이스 존재 여부 확인
-            if verbose:
-                console.print(f"[dim][DEBUG] 데이터베이스 ID 확인 중: {database_id}[/dim]")
-            if not notion.check_database_exists(database_id, verbose=verbose):
-                console.print(f"\n[red]'{auth_method}'의 데이터베이스(ID: {database_id})를 찾을 수 없습니다.[/red]")
-                total_skipped += len(records)
-                continue
-
-            # 데이터 저장
-            if verbose:
-                console.print(f"\n[cyan]'{auth_method}' 데이터베이스에 저장 중... ({len(records)}개 레코드)[/cyan]")
-            if update_existing:
-                console.print(f"[yellow]중복 데이터 발견 시 업데이트 모드[/yellow]")
-            else:
-                console.print(f"[yellow]중복 데이터 발견 시 스킵 모드 (중복 방지)[/yellow]")
+                # 데이터 저장
+                if verbose:
+                    console.print(f"\n[cyan]'{auth_method}' 데이터베이스에 저장 중... ({len(records)}개 레코드)[/cyan]")
+                if update_existing:
+                    console.print(f"[yellow]중복 데이터 발견 시 업데이트 모드[/yellow]")
+                else:
+                    console.print(f"[yellow]중복 데이터 발견 시 스킵 모드 (중복 방지)[/yellow]")
 
-            stats = notion.save_usage_data(database_id, records, update_existing=update_existing, verbose=verbose)
-            total_created += stats["created"]
-            total_updated += stats["updated"]
-            total_skipped += stats["skipped"]
+                stats = notion.save_usage_data(database_id, records, update_existing=update_existing, verbose=verbose)
+                total_created += stats["created"]
+                total_updated += stats["updated"]
+                total_skipped += stats["skipped"]
 
-            if verbose:
-                console.print(f"[green]생성: {stats['created']}, 업데이트: {stats['updated']}, 스킵: {stats['skipped']}[/green]")
+                if verbose:
+                    console.print(f"[green]생성: {stats['created']}, 업데이트: {stats['updated']}, 스킵: {stats['skipped']}[/green]")
 
-        console.print(f"\n[green]✓ Notion 저장 완료 (생성: {total_created}, 업데이트: {total_updated}, 스킵: {total_skipped})[/green]")
+            console.print(f"\n[green]✓ Notion 저장 완료 (생성: {total_created}, 업데이트: {total_updated}, 스킵: {total_skipped})[/green]")
 
     except Exception as e:
         console.print(f"\n[red]Notion 저장 중 오류 발생: {e}[/red]")
@@ -229,6 +240,9 @@ def execute_query(
     end: datetime
 ) -> None:
     """실제 조회 실행"""
+    import api_client
+    import formatter
+    console = _get_console()
     try:
         console.print()
 
@@ -244,21 +258,20 @@ def execute_query(
 
         timezone = args.timezone or config.get_timezone()
 
-        # API 클라이언트 생성
-        client = api_client.FalAPIClient(api_key)
-
         # 2단계: Usage API 호출
         console.print("[cyan]⏳ 사용량 데이터 조회 중...[/cyan]")
 
-        usage_data = client.get_usage(
-            endpoint_ids=models,
-            start=start,
-            end=end,
-            timeframe=args.timeframe,
-            timezone=timezone,
-            bound_to_timeframe=args.bound_to_timeframe,
-            include_notion=args.notion
-        )
+        # API 클라이언트 생성 (Session 연결은 조회 후 정리)
+        with api_client.FalAPIClient(api_key) as client:
+            usage_data = client.get_usage(
+                endpoint_ids=models,
+                start=start,
+                end=end,
+                timeframe=args.timeframe,
+                timezone=timezone,
+                bound_to_timeframe=args.bound_to_timeframe,
+                include_notion=args.notion
+            )
 
         console.print("[green]✓ 데이터 조회 완료[/green]")
 
@@ -313,13 +326,13 @@ def main():
             cli_mode(args)
 
     except KeyboardInterrupt:
-        console.print("\n\n[yellow]프로그램을 종료합니다.[/yellow]")
+        _get_console().print("\n\n[yellow]프로그램을 종료합니다.[/yellow]")
         sys.exit(0)
     except ValueError as e:
-        console.print(f"[red]{e}[/red]", file=sys.stderr)
+        _get_console().print(f"[red]{e}[/red]", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]예상치 못한 오류: {e}[/red]", file=sys.stderr)
+        _get_console().print(f"[red]예상치 못한 오류: {e}[/red]", file=sys.stderr)
         if 'args' in locals() and args.verbose:
             import traceback
             traceback.print_exc()
@@ -328,9 +341,19 @@ def main():
 
 def interactive_mode(args) -> None:
     """인터랙티브 모드"""
+    # 메뉴 모듈은 인터랙티브 모드에서만 필요하므로 CLI 모드 시작 비용에서 제외
+    from rich.prompt import Prompt
+    import cli_menus
+    console = _get_console()
+
     date_settings = {}
 
     while True:
+        # 하위 메뉴에서 변경한 설정은 메인 메뉴로 돌아올 때 바로 기록
+        try:
+            config.flush_config()
+        except IOError as e:
+            console.print(f"[red]오류: {e}[/red]")
         choice = cli_menus.show_main_menu()
 
         if choice == 1:
@@ -362,6 +385,7 @@ def interactive_mode(args) -> None:
 
 def cli_mode(args) -> None:
     """CLI 모드 (기존 동작)"""
+    console = _get_console()
     # API 키 가져오기
     api_key = config.get_api_key(args.api_key)
     if not api_key:
@@ -382,6 +406,7 @@ def cli_mode(args) -> None:
     if args.verbose:
         console.print(f"[dim]모델 목록: {', '.join(models)}[/dim]")
         if args.models:
+            config.flush_config()
             console.print(f"[dim]모델 목록이 config.json에 저장되었습니다.[/dim]")
 
     # 날짜 범위 파싱
@@ -50,6 +50,25 @@ class NotionClient:
         self.client = Client(auth=api_key)
         self.api_key = api_key
         self.api_base_url = "https://api.notion.com/v1"
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Notion-Version": "2022-06-28"
+        }
+
+        # 레코드마다 호출되는 중복 체크 쿼리가 연결(TLS 핸드셰이크)을 재사용하도록 Session 사용
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+    
+    def close(self) -> None:
+        """Session 종료 (풀링된 연결 해제)"""
+        self._session.close()
+    
+    def __enter__(self) -> "NotionClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def check_database_exists(self, database_id: str, verbose: bool = False) -> bool:
         """
@@ -139,12 +158,6 @@ class NotionClient:
                 print(f"[DEBUG] 중복 체크 시작: date={date}, model={model}{time_info}")
 
             # 먼저 날짜로만 필터링 (HTTP API 직접 호출)
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "Notion-Version": "2022-06-28"
-            }
-
             query_payload = {
                 "filter": {
                     "property": "Date",
@@ -155,7 +168,7 @@ class NotionClient:
             }
 
             query_url = f"{self.api_base_url}/databases/{formatted_id}/query"
-            response = requests.post(query_url, headers=headers, json=query_payload)
+            response = self._session.post(query_url, json=query_payload)
 
             if response.status_code != 200:
                 if verbose:
@@ -2,69 +2,32 @@
 사용량 추적 로직
 Usage API 데이터 처리 및 집계
 """
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from typing import DefaultDict, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 
-def parse_usage_data(usage_data: Dict[str, Any]) -> Dict[str, Any]:
+def _key_alias(auth_method: Any) -> str:
     """
-    Usage API 응답 데이터 파싱
+    auth_method 값에서 키 별칭 추출
     
-    공식 문서 형식:
-    - time_series: [{"bucket": "...", "results": [...]}, ...]
-    - summary: [{"endpoint_id": "...", "quantity": ..., "cost": ...}, ...]
-    
-    Returns:
-        파싱된 데이터 구조
+    문자열이면 그대로, 딕셔너리면 key_alias 필드, 그 외에는 "Unknown"
+    (JSON에서 온 값이므로 isinstance 대신 정확한 타입 비교)
     """
+    value_type = type(auth_method)
+    if value_type is str:
+        return auth_method
+    if value_type is dict:
+        return auth_method.get("key_alias", "Unknown")
+    return "Unknown"
+
+
+def _extract_time_series(usage_data: Any) -> List[Any]:
+    """Usage API 응답에서 time_series 리스트만 추출 (형식이 다르면 빈 리스트)"""
     if not isinstance(usage_data, dict):
-        return {
-            "meta": {},
-            "summary": {},
-            "time_series": [],
-            "auth_methods": {},
-            "raw_items": []
-        }
-    
-    meta = usage_data.get("_meta", {})
-    
-    # 최상위 time_series 추출 (공식 문서 형식)
+        return []
     time_series = usage_data.get("time_series", [])
-    if not isinstance(time_series, list):
-        time_series = []
-    
-    # 최상위 summary 추출 (리스트 형식)
-    summary = usage_data.get("summary", {})
-    if not isinstance(summary, (dict, list)):
-        summary = {}
-    
-    # auth_method 정보 추출 (summary 리스트에서)
-    auth_methods = {}
-    if isinstance(summary, list):
-        for item in summary:
-            if isinstance(item, dict) and "auth_method" in item:
-                auth_method = item.get("auth_method")
-                if isinstance(auth_method, str):
-                    key_alias = auth_method
-                elif isinstance(auth_method, dict):
-                    key_alias = auth_method.get("key_alias", "Unknown")
-                else:
-                    key_alias = "Unknown"
-                
-                if key_alias not in auth_methods:
-                    auth_methods[key_alias] = {
-                        "requests": 0,
-                        "quantity": 0,
-                        "cost": 0.0
-                    }
-    
-    return {
-        "meta": meta,
-        "summary": summary,
-        "time_series": time_series,
-        "auth_methods": auth_methods,
-        "raw_items": []
-    }
+    return time_series if isinstance(time_series, list) else []
 
 
 def parse_pricing_data(pricing_data: Dict[str, Any]) -> Dict[str, float]:
@@ -74,8 +37,6 @@ def parse_pricing_data(pricing_data: Dict[str, Any]) -> Dict[str, float]:
     Returns:
         {endpoint_id: unit_price} 딕셔너리
     """
-    pricing_map = {}
-    
     # items, data, 또는 prices 필드 확인
     items = pricing_data.get("items", pricing_data.get("data", pricing_data.get("prices", [])))
     
@@ -83,14 +44,31 @@ def parse_pricing_data(pricing_data: Dict[str, Any]) -> Dict[str, float]:
     if not isinstance(items, list):
         items = [items] if items else []
     
-    for item in items:
-        if isinstance(item, dict):
-            endpoint_id = item.get("endpoint_id") or item.get("model")
-            unit_price = item.get("unit_price") or item.get("price")
-            if endpoint_id and unit_price is not None:
-                pricing_map[endpoint_id] = float(unit_price)
-    
-    return pricing_map
+    # (endpoint_id, unit_price) 쌍을 항목당 한 번씩만 추출해 바로 딕셔너리로 생성
+    pairs = (
+        (item.get("endpoint_id") or item.get("model"), item.get("unit_price") or item.get("price"))
+        for item in items
+        if isinstance(item, dict)
+    )
+    return {
+        endpoint_id: float(unit_price)
+        for endpoint_id, unit_price in pairs
+        if endpoint_id and unit_price is not None
+    }
+
+
+def _cost_key(item: Tuple[str, Dict[str, Any]]) -> float:
+    """(이름, 통계) 항목의 비용 (비용 순 정렬 키)"""
+    return item[1]["cost"]
+
+
+def _new_key_stats() -> Dict[str, Any]:
+    """키별 집계 초기값"""
+    return {
+        "requests": 0,
+        "quantity": 0,
+        "cost": 0.0
+    }
 
 
 def calculate_costs(
@@ -99,21 +77,33 @@ def calculate_costs(
     """
     사용량 데이터에서 비용 계산 (Usage API의 unit_price 사용)
     
+    time_series와 summary를 각각 한 번씩만 순회하며
+    모델별/키별/전체 집계를 함께 계산
+    
     Returns:
         계산된 데이터 구조
     """
-    parsed = parse_usage_data(usage_data)
+    if not isinstance(usage_data, dict):
+        usage_data = {}
+    
+    meta = usage_data.get("_meta", {})
+    time_series = _extract_time_series(usage_data)
+    
+    # summary는 리스트 형식일 때만 집계에 사용
+    summary = usage_data.get("summary")
+    if not isinstance(summary, list):
+        summary = []
     
     # 모델별 집계
     model_stats = {}
-    # 키별 집계
-    auth_methods = parsed.get("auth_methods", {})
+    # 키별 집계 (처음 보는 키는 빈 통계로 자동 생성)
+    auth_methods: DefaultDict[str, Dict[str, Any]] = defaultdict(_new_key_stats)
     total_requests = 0
     total_quantity = 0
     total_cost = 0.0
     
     # time_series 데이터 처리 (공식 문서 형식: bucket과 results 구조)
-    for bucket_entry in parsed["time_series"]:
+    for bucket_entry in time_series:
         if not isinstance(bucket_entry, dict):
             continue
         
@@ -137,50 +127,46 @@ def calculate_costs(
             # requests는 quantity와 동일하게 처리 (API에서 제공하지 않는 경우)
             requests = result.get("requests", quantity)
             
-            # 모델별 집계
-            if endpoint_id not in model_stats:
-                model_stats[endpoint_id] = {
+            # 모델별 집계 (딕셔너리 조회는 한 번만)
+            stats = model_stats.get(endpoint_id)
+            if stats is None:
+                stats = model_stats[endpoint_id] = {
                     "requests": 0,
                     "quantity": 0,
                     "cost": 0.0,
                     "unit_price": unit_price
                 }
             
-            model_stats[endpoint_id]["requests"] += requests
-            model_stats[endpoint_id]["quantity"] += quantity
-            model_stats[endpoint_id]["cost"] += cost
+            stats["requests"] += requests
+            stats["quantity"] += quantity
+            stats["cost"] += cost
             
             # 키별 집계
             auth_method = result.get("auth_method")
             if auth_method:
-                if isinstance(auth_method, str):
-                    key_alias = auth_method
-                elif isinstance(auth_method, dict):
-                    key_alias = auth_method.get("key_alias", "Unknown")
-                else:
-                    key_alias = "Unknown"
-                
-                if key_alias not in auth_methods:
-                    auth_methods[key_alias] = {
-                        "requests": 0,
-                        "quantity": 0,
-                        "cost": 0.0
-                    }
+                key_alias = _key_alias(auth_method)
+                key_stats = auth_methods[key_alias]
                 
-                auth_methods[key_alias]["requests"] += requests
-                auth_methods[key_alias]["quantity"] += quantity
-                auth_methods[key_alias]["cost"] += cost
+                key_stats["requests"] += requests
+                key_stats["quantity"] += quantity
+                key_stats["cost"] += cost
             
             total_requests += requests
             total_quantity += quantity
             total_cost += cost
     
     # summary 리스트 처리 (summary 형식)
-    if isinstance(parsed["summary"], list):
-        for item in parsed["summary"]:
+    if summary:
+        for item in summary:
             if not isinstance(item, dict):
                 continue
             
+            # auth_method 필드가 있는 항목은 사용량이 없어도 키 목록에 표시
+            auth_method = item.get("auth_method")
+            if "auth_method" in item:
+                key_alias = _key_alias(auth_method)
+                key_stats = auth_methods[key_alias]
+            
             endpoint_id = item.get("endpoint_id")
             if not endpoint_id:
                 continue
@@ -192,9 +178,10 @@ def calculate_costs(
             # unit_price 추출
             unit_price = item.get("unit_price", 0.0)
             
-            # 모델별 집계
-            if endpoint_id not in model_stats:
-                model_stats[endpoint_id] = {
+            # 모델별 집계 (딕셔너리 조회는 한 번만)
+            stats = model_stats.get(endpoint_id)
+            if stats is None:
+                stats = model_stats[endpoint_id] = {
                     "requests": 0,
                     "quantity": 0,
                     "cost": 0.0,
@@ -205,30 +192,15 @@ def calculate_costs(
             if cost == 0.0:
                 cost = quantity * unit_price if unit_price else 0.0
             
-            model_stats[endpoint_id]["requests"] += requests
-            model_stats[endpoint_id]["quantity"] += quantity
-            model_stats[endpoint_id]["cost"] += cost
+            stats["requests"] += requests
+            stats["quantity"] += quantity
+            stats["cost"] += cost
             
-            # 키별 집계
-            auth_method = item.get("auth_method")
+            # 키별 집계 (키 항목은 위에서 이미 생성됨)
             if auth_method:
-                if isinstance(auth_method, str):
-                    key_alias = auth_method
-                elif isinstance(auth_method, dict):
-                    key_alias = auth_method.get("key_alias", "Unknown")
-                else:
-                    key_alias = "Unknown"
-                
-                if key_alias not in auth_methods:
-                    auth_methods[key_alias] = {
-                        "requests": 0,
-                        "quantity": 0,
-                        "cost": 0.0
-                    }
-                
-                auth_methods[key_alias]["requests"] += requests
-                auth_methods[key_alias]["quantity"] += quantity
-                auth_methods[key_alias]["cost"] += cost
+                key_stats["requests"] += requests
+                key_stats["quantity"] += quantity
+                key_stats["cost"] += cost
             
             total_requests += requests
             total_quantity += quantity
@@ -241,8 +213,11 @@ def calculate_costs(
             "cost": total_cost
         },
         "by_model": model_stats,
-        "by_auth_method": auth_methods,
-        "meta": parsed["meta"]
+        # 출력 시 다시 정렬하지 않도록 비용 내림차순 (endpoint_id, 통계) 목록도 함께 제공
+        "by_model_sorted": sorted(model_stats.items(), key=_cost_key, reverse=True),
+        # 호출자가 없는 키를 조회해도 항목이 생기지 않도록 일반 dict로 반환
+        "by_auth_method": dict(auth_methods),
+        "meta": meta
     }
 
 
@@ -259,10 +234,11 @@ def format_for_notion(
     Returns:
         {auth_method: [일별 데이터 리스트]} 딕셔너리
     """
-    parsed = parse_usage_data(usage_data)
+    # summary는 사용하지 않으므로 _meta와 time_series만 추출
+    meta = usage_data.get("_meta", {}) if isinstance(usage_data, dict) else {}
+    time_series = _extract_time_series(usage_data)
     
     # timeframe 확인 (시/분 단위인지 체크)
-    meta = parsed.get("meta", {})
     timeframe = meta.get("timeframe")
     
     # timeframe이 명시되지 않았을 때 기간 길이로 자동 판단
@@ -302,21 +278,21 @@ def format_for_notion(
     notion_data_by_auth: Dict[str, List[Dict[str, Any]]] = {}
     
     # time_series 데이터 처리 (bucket과 results 구조)
-    for bucket_entry in parsed["time_series"]:
+    for bucket_entry in time_series:
         if not isinstance(bucket_entry, dict):
             continue
         
         # bucket에서 날짜와 시간 추출
         bucket = bucket_entry.get("bucket", "")
         if isinstance(bucket, str):
-            if "T" in bucket:
-                date = bucket.split("T")[0]
+            # "T"가 없으면 date는 bucket 전체, has_time은 빈 문자열
+            date, has_time, time_part = bucket.partition("T")
+            if has_time:
                 # 시/분 단위일 때만 시간 추출
                 if include_time:
-                    time_part = bucket.split("T")[1]
                     # 타임존 제거 (예: "14:30:00-05:00" -> "14:30:00")
                     if "+" in time_part:
-                        time_str = time_part.split("+")[0]
+                        time_str = time_part.partition("+")[0]
                     elif "-" in time_part:
                         # 타임존이 -05:00 형식인 경우 (마지막 - 기준으로 분리)
                         # 예: "14:30:00-05:00" -> ["14:30:00", "05:00"]
@@ -325,13 +301,12 @@ def format_for_notion(
                             # parts[1]이 타임존 형식 (예: "05:00")
                             time_str = parts[0]
                         else:
-                            time_str = time_part.split("Z")[0] if "Z" in time_part else time_part
+                            time_str = time_part.partition("Z")[0]
                     else:
-                        time_str = time_part.split("Z")[0] if "Z" in time_part else time_part
+                        time_str = time_part.partition("Z")[0]
                 else:
                     time_str = None
             else:
-                date = bucket
                 time_str = None
         else:
             continue
@@ -345,30 +320,29 @@ def format_for_notion(
             if not isinstance(result, dict):
                 continue
             
-            endpoint_id = result.get("endpoint_id")
+            # 항목당 여러 번 호출하므로 메서드를 지역 변수로 바인딩
+            get = result.get
+            
+            endpoint_id = get("endpoint_id")
             if not endpoint_id:
                 continue
             
-            quantity = result.get("quantity", 0)
-            unit_price = result.get("unit_price", 0.0)
-            cost = result.get("cost", quantity * unit_price)
-            requests = result.get("requests", quantity)
+            quantity = get("quantity", 0)
+            unit_price = get("unit_price", 0.0)
+            cost = get("cost", quantity * unit_price)
+            requests = get("requests", quantity)
             
             # auth_method 추출
-            auth_method = result.get("auth_method")
+            auth_method = get("auth_method")
             if auth_method:
-                if isinstance(auth_method, str):
-                    key_alias = auth_method
-                elif isinstance(auth_method, dict):
-                    key_alias = auth_method.get("key_alias", "Unknown")
-                else:
-                    key_alias = "Unknown"
+                key_alias = _key_alias(auth_method)
             else:
                 key_alias = "Unknown"
             
-            # auth_method별로 그룹화
-            if key_alias not in notion_data_by_auth:
-                notion_data_by_auth[key_alias] = []
+            # auth_method별로 그룹화 (딕셔너리 조회는 한 번만)
+            records = notion_data_by_auth.get(key_alias)
+            if records is None:
+                records = notion_data_by_auth[key_alias] = []
             
             record = {
                 "date": date,
@@ -384,7 +358,7 @@ def format_for_notion(
             if time_str:
                 record["time"] = time_str
             
-            notion_data_by_auth[key_alias].append(record)
+            records.append(record)
     
     return notion_data_by_auth
 